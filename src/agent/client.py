@@ -10,6 +10,14 @@ from .models import ChatRequest, ChatResponse, SessionResponse
 
 logger = structlog.get_logger(__name__)
 
+# Keep connections to the agent warm between requests; 15s idle expiry
+# stays below common server-side keep-alive timeouts (e.g. nginx 75s)
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=15.0,
+)
+
 
 class AgentClientError(Exception):
     """Base exception for agent client errors."""
@@ -96,6 +104,7 @@ class AgentClient:
                 base_url=self.base_url,
                 headers=headers,
                 timeout=httpx.Timeout(self.timeout),
+                limits=POOL_LIMITS,
             )
         return self._client
 
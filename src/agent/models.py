@@ -6,6 +6,7 @@ Based on the Valerie Supplier Chatbot API v2.2.0 OpenAPI specification.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 
@@ -36,7 +37,26 @@ class MessageRole(str, Enum):
     SYSTEM = "system"
 
 
-@dataclass
+# Value -> member lookups for the hot from_dict paths. A dict hit skips the
+# Enum metaclass call; misses fall through to it so bad values still raise
+# ValueError.
+_AGENT_STATUS = {s.value: s for s in AgentStatus}
+_SESSION_STATUS = {s.value: s for s in SessionStatus}
+_MESSAGE_ROLE = {r.value: r for r in MessageRole}
+
+
+@lru_cache(maxsize=2048)
+def _parse_ts(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, reusing results for repeated strings.
+
+    Session history re-sends the same message timestamps on every fetch, and
+    datetime is immutable, so cached instances are safe to share.
+    """
+    # fromisoformat accepts a trailing "Z" since Python 3.11
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class ChatRequest:
     """Request to send a chat message to the agent.
 
@@ -60,7 +80,7 @@ class ChatRequest:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentExecution:
     """Details of an agent's execution in the pipeline.
 
@@ -81,16 +101,17 @@ class AgentExecution:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "AgentExecution":
         """Create from API response dictionary."""
+        status = data["status"]
         return cls(
             agent_name=data["agent_name"],
             display_name=data["display_name"],
-            status=AgentStatus(data["status"]),
+            status=_AGENT_STATUS.get(status) or AgentStatus(status),
             duration_ms=data.get("duration_ms", 0),
             output=data.get("output", {}),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatResponse:
     """Response from the chat endpoint.
 
@@ -113,7 +134,8 @@ class ChatResponse:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ChatResponse":
         """Create from API response dictionary."""
-        agents = [AgentExecution.from_dict(a) for a in data.get("agents_executed", [])]
+        from_dict = AgentExecution.from_dict
+        agents = [from_dict(a) for a in data.get("agents_executed", ())]
         return cls(
             session_id=data["session_id"],
             message=data["message"],
@@ -124,7 +146,7 @@ class ChatResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A single chat message in session history.
 
@@ -141,17 +163,16 @@ class Message:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Message":
         """Create from API response dictionary."""
-        ts = None
-        if data.get("timestamp"):
-            ts = datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00"))
+        raw_ts = data.get("timestamp")
+        role = data["role"]
         return cls(
-            role=MessageRole(data["role"]),
+            role=_MESSAGE_ROLE.get(role) or MessageRole(role),
             content=data["content"],
-            timestamp=ts,
+            timestamp=_parse_ts(raw_ts) if raw_ts else None,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionResponse:
     """Response with session details.
 
@@ -174,12 +195,14 @@ class SessionResponse:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SessionResponse":
         """Create from API response dictionary."""
-        messages = [Message.from_dict(m) for m in data.get("messages", [])]
+        from_dict = Message.from_dict
+        messages = [from_dict(m) for m in data.get("messages", ())]
+        status = data["status"]
         return cls(
             session_id=data["session_id"],
-            status=SessionStatus(data["status"]),
-            created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-            last_activity=datetime.fromisoformat(data["last_activity"].replace("Z", "+00:00")),
+            status=_SESSION_STATUS.get(status) or SessionStatus(status),
+            created_at=_parse_ts(data["created_at"]),
+            last_activity=_parse_ts(data["last_activity"]),
             message_count=data["message_count"],
             messages=messages,
         )
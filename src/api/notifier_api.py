@@ -8,7 +8,7 @@ from typing import Optional
 
 import structlog
 import uvicorn
-from fastapi import FastAPI, Header, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException
 from pydantic import BaseModel, Field
 
 from ..core.config import settings
@@ -145,6 +145,7 @@ async def health() -> HealthResponse:
 async def notify(
     request: NotifyRequest,
     api_key: str = Header(..., alias="X-API-Key"),
+    service: NotificationService = Depends(get_service),
 ) -> NotifyResponse:
     """
     Send a notification to a Teams channel.
@@ -153,8 +154,6 @@ async def notify(
     """
     verify_api_key(api_key)
 
-    service = get_service()
-
     try:
         notification = await service.notify(
             channel=request.channel,
@@ -184,6 +183,7 @@ async def notify(
 @app.get("/api/v1/channels", response_model=ChannelsResponse)
 async def list_channels(
     api_key: str = Header(..., alias="X-API-Key"),
+    channels: ChannelRegistry = Depends(get_channels),
 ) -> ChannelsResponse:
     """
     List available notification channels.
@@ -192,8 +192,6 @@ async def list_channels(
     """
     verify_api_key(api_key)
 
-    channels = get_channels()
-
     return ChannelsResponse(
         channels=[
             ChannelInfo(
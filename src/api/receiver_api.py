@@ -12,11 +12,12 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 import structlog
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
 
 from src.agent import AgentClient
 from src.core.config import settings
+from src.core.logging import setup_logging
 from src.teams.receiver import (
     HMACVerificationError,
     HMACVerifier,
@@ -30,13 +31,14 @@ logger = structlog.get_logger(__name__)
 # Global instances (initialized on startup)
 _agent_client: AgentClient | None = None
 _message_handler: TeamsMessageHandler | None = None
-_hmac_verifier: HMACVerifier | None = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
-    global _agent_client, _message_handler, _hmac_verifier
+    global _agent_client, _message_handler
+
+    setup_logging()
 
     logger.info(
         "receiver_starting",
@@ -59,9 +61,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         error_message="I'm having trouble connecting to my knowledge base. Please try again in a moment.",
     )
 
-    # Initialize HMAC verifier (optional)
-    _hmac_verifier = create_verifier(settings.teams_hmac_secret)
-    if not _hmac_verifier:
+    # Validate the HMAC secret up front: a malformed one stops startup with
+    # ValueError instead of silently serving unverified requests
+    if not create_verifier(settings.teams_hmac_secret, strict=True):
         logger.warning(
             "hmac_verification_disabled",
             reason="TEAMS_HMAC_SECRET not configured",
@@ -84,6 +86,16 @@ app = FastAPI(
 )
 
 
+def get_verifier() -> HMACVerifier | None:
+    """Get the HMAC verifier for the configured secret (None when HMAC is disabled).
+
+    Looks the current secret up in create_verifier's per-secret cache, so
+    after the first request this costs a dictionary lookup; a malformed
+    secret never gets this far, because the lifespan refuses to start.
+    """
+    return create_verifier(settings.teams_hmac_secret)
+
+
 @app.get("/health")
 async def health_check() -> dict[str, Any]:
     """Health check endpoint.
@@ -105,7 +117,7 @@ async def health_check() -> dict[str, Any]:
         "status": "healthy",
         "version": "2.0.0",
         "phase": "2-stateless",
-        "hmac_enabled": _hmac_verifier is not None,
+        "hmac_enabled": get_verifier() is not None,
         "agent": {
             "url": settings.agent_base_url,
             "status": agent_status,
@@ -121,7 +133,10 @@ async def webhook_get() -> dict[str, str]:
 
 
 @app.post("/webhook")
-async def webhook_handler(request: Request) -> JSONResponse:
+async def webhook_handler(
+    request: Request,
+    verifier: HMACVerifier | None = Depends(get_verifier),
+) -> Response:
     """Handle incoming Teams Outgoing Webhook messages.
 
     This endpoint receives messages when users @mention the bot in Teams.
@@ -137,10 +152,10 @@ async def webhook_handler(request: Request) -> JSONResponse:
     body = await request.body()
 
     # Verify HMAC signature if configured
-    if _hmac_verifier:
+    if verifier:
         auth_header = request.headers.get("Authorization")
         try:
-            _hmac_verifier.verify(auth_header, body)
+            verifier.verify(auth_header, body)
         except HMACVerificationError as e:
             logger.warning("hmac_verification_failed", error=str(e))
             raise HTTPException(status_code=401, detail="Invalid signature")
@@ -170,7 +185,7 @@ async def webhook_handler(request: Request) -> JSONResponse:
     try:
         response = await _message_handler.handle(message)
         log.info("webhook_response_sent")
-        return JSONResponse(content=response.to_dict())
+        return Response(content=response.to_json_bytes(), media_type="application/json")
 
     except Exception as e:
         log.error("handler_error", error=str(e))
@@ -183,7 +198,7 @@ async def webhook_handler(request: Request) -> JSONResponse:
 
 
 @app.post("/api/v1/test-message")
-async def test_message(request: Request) -> JSONResponse:
+async def test_message(request: Request) -> Response:
     """Test endpoint for sending messages without HMAC verification.
 
     Only available in development mode. Useful for testing with Postman.
@@ -201,7 +216,7 @@ async def test_message(request: Request) -> JSONResponse:
         raise HTTPException(status_code=503, detail="Service not ready")
 
     response = await _message_handler.handle(message)
-    return JSONResponse(content=response.to_dict())
+    return Response(content=response.to_json_bytes(), media_type="application/json")
 
 
 def create_app() -> FastAPI:
@@ -2,7 +2,7 @@
 Core module - shared utilities.
 """
 
-from .config import settings
+from .config import get_settings, settings
 from .exceptions import (
     AgentConnectionError,
     AgentError,
@@ -11,10 +11,11 @@ from .exceptions import (
     TeamsError,
     WebhookVerificationError,
 )
-from .logging import get_logger, setup_logging
+from .logging import get_logger, setup_logging, shutdown_logging
 
 __all__ = [
     "settings",
+    "get_settings",
     "TeamsAgentError",
     "AgentError",
     "AgentTimeoutError",
@@ -23,4 +24,5 @@ __all__ = [
     "WebhookVerificationError",
     "get_logger",
     "setup_logging",
+    "shutdown_logging",
 ]
@@ -6,6 +6,7 @@ All settings are loaded from environment variables or .env file.
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 from pydantic_settings import BaseSettings
@@ -66,6 +67,7 @@ class Settings(BaseSettings):
     session_store: str = "memory"
     session_ttl_hours: int = 24
     session_max_messages: int = 50
+    session_cache_ttl_seconds: float = 0  # In-process lookup cache; 0 disables
     redis_url: str = "redis://localhost:6379/0"
 
     class Config:
@@ -74,5 +76,16 @@ class Settings(BaseSettings):
         extra = "ignore"
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing the environment only once.
+
+    Consumers import the module-level ``settings`` built from this at import
+    time, so clearing the cache does not change what they see; tests override
+    individual fields on ``settings`` (e.g. with monkeypatch.setattr) instead.
+    """
+    return Settings()
+
+
 # Singleton instance
-settings = Settings()
+settings = get_settings()
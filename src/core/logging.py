@@ -4,44 +4,68 @@ Structured logging configuration.
 Uses structlog for structured, context-rich logging.
 - Development: colored console output
 - Production: JSON output for log aggregators
+
+Records are handed to a background thread via a queue so that stream
+writes never block the event loop.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
+import orjson
 import structlog
-from structlog.typing import Processor
+from structlog.typing import FilteringBoundLogger, Processor
 
 from .config import settings
 
 _configured = False
+_listener: QueueListener | None = None
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSON serializer for structlog's JSONRenderer backed by orjson."""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode("utf-8")
 
 
 def setup_logging() -> None:
     """Configure structured logging."""
-    global _configured
+    global _configured, _listener
 
     if _configured:
         return
 
-    # Set up stdlib logging
+    level = getattr(logging, settings.log_level.upper())
+
+    # Set up stdlib logging: callers only enqueue, the listener thread writes
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, settings.log_level.upper()),
+        handlers=[QueueHandler(log_queue)],
+        level=level,
     )
 
     # Choose renderer based on environment
     renderer: Processor
     if settings.environment == "production":
-        renderer = structlog.processors.JSONRenderer()
+        renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     else:
         renderer = structlog.dev.ConsoleRenderer(colors=True)
 
+    # The filtering wrapper drops calls below the configured level before any
+    # event dict is built, so no filter_by_level processor is needed
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
+            structlog.contextvars.merge_contextvars,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
@@ -50,7 +74,7 @@ def setup_logging() -> None:
             structlog.processors.UnicodeDecoder(),
             renderer,
         ],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -59,7 +83,16 @@ def setup_logging() -> None:
     _configured = True
 
 
-def get_logger(name: Optional[str] = None) -> structlog.stdlib.BoundLogger:
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background writer."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: Optional[str] = None) -> FilteringBoundLogger:
     """
     Get a configured logger.
 
@@ -74,5 +107,5 @@ def get_logger(name: Optional[str] = None) -> structlog.stdlib.BoundLogger:
         logger.info("message", key="value")
     """
     setup_logging()
-    logger: structlog.stdlib.BoundLogger = structlog.get_logger(name)
+    logger: FilteringBoundLogger = structlog.get_logger(name)
     return logger
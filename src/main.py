@@ -13,10 +13,11 @@ from typing import TYPE_CHECKING
 import structlog
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
 
 from src.agent import AgentClient
 from src.core.config import IntegrationMode, settings
+from src.core.logging import setup_logging
 from src.dashboard.api import (
     DashboardStatus,
     ServiceStatus,
@@ -61,6 +62,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     global _agent_client, _message_handler, _hmac_verifier, _session_store
     global _unified_processor, _bot_adapter, _bot_instance, _proactive_messenger
 
+    setup_logging()
+
     integration_mode = settings.teams_integration_mode
 
     logger.info(
@@ -78,6 +81,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         store_type=settings.session_store,
         redis_url=settings.redis_url,
         ttl_hours=settings.session_ttl_hours,
+        cache_ttl_seconds=settings.session_cache_ttl_seconds,
     )
 
     _agent_client = AgentClient(
@@ -105,7 +109,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             error_message="I'm having trouble connecting to my knowledge base. Please try again in a moment.",
         )
 
-        _hmac_verifier = create_verifier(settings.teams_hmac_secret)
+        # A malformed secret stops startup rather than disabling verification
+        _hmac_verifier = create_verifier(settings.teams_hmac_secret, strict=True)
         if not _hmac_verifier:
             logger.warning(
                 "hmac_verification_disabled",
@@ -157,7 +162,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     # Cleanup
-    if _session_store and hasattr(_session_store, 'close'):
+    if _session_store:
         await _session_store.close()
     if _agent_client:
         await _agent_client.close()
@@ -236,7 +241,7 @@ async def webhook_get():
 
 
 @app.post("/webhook")
-async def webhook_handler(request: Request) -> JSONResponse:
+async def webhook_handler(request: Request) -> Response:
     """Handle incoming Teams Outgoing Webhook messages.
 
     This endpoint receives messages when users @mention the bot in Teams.
@@ -337,7 +342,7 @@ async def webhook_handler(request: Request) -> JSONResponse:
     try:
         response = await _message_handler.handle(message)
         log.info("webhook_response_sent")
-        return JSONResponse(content=response.to_dict())
+        return Response(content=response.to_json_bytes(), media_type="application/json")
 
     except Exception as e:
         log.error("handler_error", error=str(e))
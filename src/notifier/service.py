@@ -64,7 +64,8 @@ class NotificationService:
             title: Optional title
             card_type: Card type (alert, info, report) or None for text
             priority: Priority level
-            metadata: Additional data for card templates
+            metadata: Additional data; keys in AdaptiveCardBuilder.OPTIONS
+                are passed to the card builder
 
         Returns:
             Notification object with delivery status
@@ -99,12 +100,15 @@ class NotificationService:
         try:
             if card_type:
                 # Build and send card
+                # metadata may carry caller data kept only on the notification;
+                # build() rejects unknown keys, so pass just the card options
+                options = {k: v for k, v in (metadata or {}).items() if k in self.cards.OPTIONS}
                 card = self.cards.build(
                     card_type=card_type,
                     title=title or "Notificación",
                     message=message,
                     priority=priority,
-                    **(metadata or {}),
+                    **options,
                 )
                 await self.sender.send_card(channel_config.webhook_url, card)
             else:
@@ -3,6 +3,7 @@
 from .store import (
     SessionData,
     SessionStore,
+    CachedSessionStore,
     MemorySessionStore,
     RedisSessionStore,
     create_session_store,
@@ -11,6 +12,7 @@ from .store import (
 __all__ = [
     "SessionData",
     "SessionStore",
+    "CachedSessionStore",
     "MemorySessionStore",
     "RedisSessionStore",
     "create_session_store",
@@ -1,7 +1,9 @@
 """Session store with Redis support for conversation continuity."""
 
 import json
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, UTC
 from typing import Optional
@@ -55,6 +57,9 @@ class SessionStore(ABC):
         """Clear all sessions. Returns count of deleted sessions."""
         pass
 
+    async def close(self) -> None:
+        """Release connections held by the store (no-op by default)."""
+
 
 class MemorySessionStore(SessionStore):
     """In-memory session store (for development/fallback)."""
@@ -221,11 +226,109 @@ class RedisSessionStore(SessionStore):
             await self._redis.close()
 
 
-def create_session_store(store_type: str, redis_url: str, ttl_hours: int) -> SessionStore:
-    """Factory function to create appropriate session store."""
+class CachedSessionStore(SessionStore):
+    """In-process TTL/LRU cache in front of another session store.
+
+    Repeated lookups for the same user/conversation within ``ttl_seconds``
+    are served locally instead of hitting the backing store. Writes go
+    through to the backing store and update or invalidate the cache.
+
+    Note: last_activity/message_count are only refreshed on cache misses.
+    """
+
+    def __init__(self, store: SessionStore, ttl_seconds: float = 60.0, maxsize: int = 10_000):
+        """Wrap a store with a lookup cache.
+
+        Args:
+            store: Backing store that all writes go through to
+            ttl_seconds: How long a looked-up session is served from memory
+            maxsize: Cached sessions kept before the least recently used is evicted
+        """
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._maxsize = maxsize
+        self._cache: OrderedDict[tuple[str, str], tuple[float, SessionData]] = OrderedDict()
+
+    async def get(self, user_id: str, conversation_id: str) -> Optional[SessionData]:
+        """Get session, from the cache while fresh, else from the backing store.
+
+        A hit is returned as-is, without the backing store's activity
+        refresh. A miss caches what the backing store returns, or drops
+        the entry if it has no session.
+        """
+        key = (user_id, conversation_id)
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            return entry[1]
+
+        session = await self._store.get(user_id, conversation_id)
+        if session:
+            self._remember(key, session)
+        else:
+            self._cache.pop(key, None)
+        return session
+
+    async def set(self, user_id: str, conversation_id: str, session_id: str) -> None:
+        """Write the session through to the backing store.
+
+        The cached entry is invalidated, not updated, so the next get
+        reads the stored session back.
+        """
+        # Drop the entry first so a failed write never leaves a stale session
+        self._cache.pop((user_id, conversation_id), None)
+        await self._store.set(user_id, conversation_id, session_id)
+
+    async def delete(self, user_id: str, conversation_id: str) -> bool:
+        """Invalidate the cached entry and delete from the backing store."""
+        self._cache.pop((user_id, conversation_id), None)
+        return await self._store.delete(user_id, conversation_id)
+
+    async def get_stats(self) -> dict:
+        """Get backing store statistics plus the number of cached sessions."""
+        stats = await self._store.get_stats()
+        return {**stats, "cached_sessions": len(self._cache)}
+
+    async def list_sessions(self) -> list[SessionData]:
+        """List sessions from the backing store; the cache is not consulted."""
+        return await self._store.list_sessions()
+
+    async def clear_all(self) -> int:
+        """Empty the cache and clear the backing store."""
+        self._cache.clear()
+        return await self._store.clear_all()
+
+    async def close(self) -> None:
+        """Close the backing store."""
+        await self._store.close()
+
+    def _remember(self, key: tuple[str, str], session: SessionData) -> None:
+        """Cache a session until its TTL, evicting the LRU entry at capacity."""
+        self._cache[key] = (time.monotonic() + self._ttl_seconds, session)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+
+def create_session_store(
+    store_type: str,
+    redis_url: str,
+    ttl_hours: int,
+    cache_ttl_seconds: float = 0,
+) -> SessionStore:
+    """Factory function to create appropriate session store.
+
+    A positive ``cache_ttl_seconds`` wraps the store in a CachedSessionStore.
+    """
+    store: SessionStore
     if store_type == "redis":
         logger.info("session_store_init", type="redis", ttl_hours=ttl_hours)
-        return RedisSessionStore(redis_url, ttl_hours)
+        store = RedisSessionStore(redis_url, ttl_hours)
     else:
         logger.info("session_store_init", type="memory", ttl_hours=ttl_hours)
-        return MemorySessionStore(ttl_hours)
+        store = MemorySessionStore(ttl_hours)
+
+    if cache_ttl_seconds > 0:
+        logger.info("session_cache_init", ttl_seconds=cache_ttl_seconds)
+        return CachedSessionStore(store, ttl_seconds=cache_ttl_seconds)
+    return store
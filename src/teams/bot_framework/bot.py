@@ -219,13 +219,19 @@ class ValerieBot(ActivityHandler):
         if not activity.entities:
             return text
 
-        for entity in activity.entities:
-            if entity.type == "mention":
-                mentioned = entity.additional_properties.get("mentioned", {})
-                if mentioned.get("id") == activity.recipient.id:
-                    # This is a mention of the bot
-                    mention_text = entity.additional_properties.get("text", "")
-                    if mention_text:
-                        text = text.replace(mention_text, "").strip()
-
-        return text
+        # Distinct mention texts of the bot, so each is replaced in one pass
+        # even when Teams repeats the entity
+        bot_id = activity.recipient.id
+        mention_texts = {
+            entity.additional_properties.get("text", "")
+            for entity in activity.entities
+            if entity.type == "mention"
+            and entity.additional_properties.get("mentioned", {}).get("id") == bot_id
+        }
+        mention_texts.discard("")
+        if not mention_texts:
+            return text
+
+        for mention_text in mention_texts:
+            text = text.replace(mention_text, "")
+        return text.strip()
@@ -22,6 +22,15 @@ COMMANDS = {
     "status": "Check agent connection status",
 }
 
+# /help output is a pure function of COMMANDS, so render it once at import
+HELP_TEXT = "\n".join(
+    [
+        "**Available Commands:**\n",
+        *(f"- `/{cmd}` - {description}" for cmd, description in COMMANDS.items()),
+        "\n**Or just ask me a question!**",
+    ]
+)
+
 
 @dataclass
 class ProcessedMessage:
@@ -248,11 +257,7 @@ class UnifiedMessageProcessor:
 
     def _build_help_response(self) -> ProcessedMessage:
         """Build the help command response."""
-        lines = ["**Available Commands:**\n"]
-        for cmd, description in COMMANDS.items():
-            lines.append(f"- `/{cmd}` - {description}")
-        lines.append("\n**Or just ask me a question!**")
-        return ProcessedMessage(text="\n".join(lines))
+        return ProcessedMessage(text=HELP_TEXT)
 
     async def _handle_clear(
         self,
@@ -1,23 +1,24 @@
 """Handler for processing Teams messages and routing to the agent."""
 
+from collections.abc import Awaitable, Callable
 from typing import Optional
 
 import structlog
 
 from src.agent import AgentClient, AgentClientError, AgentTimeoutError
 from src.session import SessionStore
+from src.teams.common.processor import HELP_TEXT
 
 from .models import TeamsMessage, TeamsResponse
 
 logger = structlog.get_logger(__name__)
 
 
-# Available commands
-COMMANDS = {
-    "help": "Show available commands",
-    "clear": "Clear conversation history (start fresh)",
-    "status": "Check agent connection status",
-}
+# Replies that never vary are frozen, so build them once at import
+_HELP_RESPONSE = TeamsResponse(text=HELP_TEXT)
+_EMPTY_QUERY_RESPONSE = TeamsResponse(
+    text="I didn't catch that. Please mention me and ask a question."
+)
 
 
 class TeamsMessageHandler:
@@ -56,6 +57,16 @@ class TeamsMessageHandler:
         self.timeout_message = timeout_message
         self.error_message = error_message
 
+        # Command name -> handler taking (args, message); keys mirror the
+        # COMMANDS listed in HELP_TEXT (src.teams.common.processor)
+        self._command_handlers: dict[
+            str, Callable[[str, TeamsMessage], Awaitable[TeamsResponse]]
+        ] = {
+            "help": lambda args, message: self._handle_help(),
+            "clear": lambda args, message: self._handle_clear(message),
+            "status": lambda args, message: self._handle_status(),
+        }
+
     async def handle(self, message: TeamsMessage) -> TeamsResponse:
         """Handle an incoming Teams message.
 
@@ -68,29 +79,40 @@ class TeamsMessageHandler:
         Returns:
             TeamsResponse to send back to Teams
         """
-        log = logger.bind(
+        # Request context is bound once and merged into every log event
+        # emitted while handling this message
+        with structlog.contextvars.bound_contextvars(
             message_id=message.id,
             user_id=message.get_user_identifier(),
             user_name=message.from_user.name,
             conversation_id=message.conversation.id,
             is_thread_reply=message.is_thread_reply(),
             reply_to_id=message.reply_to_id,
-        )
+        ):
+            return await self._route(message)
+
+    async def _route(self, message: TeamsMessage) -> TeamsResponse:
+        """Route a message to the command or query path.
+
+        Args:
+            message: The incoming Teams message
 
-        # Check if it's a command
-        if message.is_command():
-            cmd = message.get_command()
-            if cmd:
-                command, args = cmd
-                log.info("processing_command", command=command)
-                return await self._handle_command(command, args, message)
+        Returns:
+            TeamsResponse to send back to Teams
+        """
+        # Check if it's a command (None for regular messages)
+        cmd = message.get_command()
+        if cmd:
+            command, args = cmd
+            logger.info("processing_command", command=command)
+            return await self._handle_command(command, args, message)
 
         # Regular message - send to agent
         query = message.get_clean_text()
         if not query:
-            return TeamsResponse(text="I didn't catch that. Please mention me and ask a question.")
+            return _EMPTY_QUERY_RESPONSE
 
-        log.info("processing_query", query_preview=query[:50])
+        logger.info("processing_query", query_preview=query[:50])
         return await self._handle_query(query, message)
 
     async def _handle_command(
@@ -109,19 +131,12 @@ class TeamsMessageHandler:
         Returns:
             TeamsResponse with command result
         """
-        if command == "help":
-            return self._build_help_response()
-
-        elif command == "clear":
-            return await self._handle_clear(message)
-
-        elif command == "status":
-            return await self._handle_status()
-
-        else:
+        handler = self._command_handlers.get(command)
+        if handler is None:
             return TeamsResponse(
                 text=f"Unknown command: /{command}\n\nType /help for available commands."
             )
+        return await handler(args, message)
 
     async def _handle_query(
         self,
@@ -140,11 +155,6 @@ class TeamsMessageHandler:
         user_id = message.get_user_identifier()
         conversation_id = message.conversation.id
 
-        log = logger.bind(
-            user_id=user_id,
-            conversation_id=conversation_id,
-        )
-
         # Look up existing session
         session_id = None
         if self.session_store:
@@ -152,13 +162,13 @@ class TeamsMessageHandler:
                 session_data = await self.session_store.get(user_id, conversation_id)
                 if session_data:
                     session_id = session_data.session_id
-                    log.debug(
+                    logger.debug(
                         "session_found",
                         session_id=session_id,
                         message_count=session_data.message_count,
                     )
             except Exception as e:
-                log.warning("session_lookup_error", error=str(e))
+                logger.warning("session_lookup_error", error=str(e))
 
         try:
             # Send to agent with session_id if available
@@ -168,7 +178,7 @@ class TeamsMessageHandler:
                 session_id=session_id,
             )
 
-            log.info(
+            logger.info(
                 "agent_response_received",
                 session_id=response.session_id,
                 intent=response.intent,
@@ -181,19 +191,19 @@ class TeamsMessageHandler:
                     # Only store if we don't have a session or the session_id changed
                     if not session_id or session_id != response.session_id:
                         await self.session_store.set(user_id, conversation_id, response.session_id)
-                        log.debug("session_stored", session_id=response.session_id)
+                        logger.debug("session_stored", session_id=response.session_id)
                 except Exception as e:
-                    log.warning("session_store_error", error=str(e))
+                    logger.warning("session_store_error", error=str(e))
 
             # Format response for Teams
             return self._format_agent_response(response.message, response.intent)
 
         except AgentTimeoutError:
-            log.warning("agent_timeout")
+            logger.warning("agent_timeout")
             return TeamsResponse(text=self.timeout_message)
 
         except AgentClientError as e:
-            log.error("agent_error", error=str(e))
+            logger.error("agent_error", error=str(e))
             return TeamsResponse(text=self.error_message)
 
     def _format_agent_response(
@@ -214,13 +224,9 @@ class TeamsMessageHandler:
         # Future: Could add Adaptive Cards for rich responses
         return TeamsResponse(text=message)
 
-    def _build_help_response(self) -> TeamsResponse:
-        """Build the help command response."""
-        lines = ["**Available Commands:**\n"]
-        for cmd, description in COMMANDS.items():
-            lines.append(f"- `/{cmd}` - {description}")
-        lines.append("\n**Or just ask me a question!**")
-        return TeamsResponse(text="\n".join(lines))
+    async def _handle_help(self) -> TeamsResponse:
+        """Handle the /help command."""
+        return _HELP_RESPONSE
 
     async def _handle_clear(self, message: TeamsMessage) -> TeamsResponse:
         """Handle the /clear command.
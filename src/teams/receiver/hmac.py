@@ -7,11 +7,15 @@ The signature is sent in the Authorization header as: HMAC <base64-signature>
 import base64
 import hashlib
 import hmac
+from functools import lru_cache
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Request bodies accepted by the verifier; hashlib reads any of these without copying
+BodyBuffer = bytes | bytearray | memoryview
+
 
 class HMACVerificationError(Exception):
     """Raised when HMAC signature verification fails."""
@@ -52,30 +56,28 @@ class HMACVerifier:
         except Exception as e:
             raise ValueError(f"Invalid Base64 secret: {e}") from e
 
-        self._secret = secret
+        # Keyed HMAC state; copied per request so the key pads are only derived once
+        self._prepared = hmac.new(self._secret_bytes, b"", hashlib.sha256)
 
-    def _compute_signature(self, body: bytes) -> str:
-        """Compute HMAC-SHA256 signature for the request body.
+    def _compute_digest(self, body: BodyBuffer) -> bytes:
+        """Compute the raw HMAC-SHA256 digest for the request body.
 
         Args:
-            body: Raw request body bytes
+            body: Raw request body (bytes or any buffer over them)
 
         Returns:
-            Base64-encoded signature string
+            32-byte signature digest
         """
-        signature = hmac.new(
-            self._secret_bytes,
-            body,
-            hashlib.sha256,
-        ).digest()
-        return base64.b64encode(signature).decode("utf-8")
-
-    def verify(self, auth_header: str | None, body: bytes) -> bool:
+        h = self._prepared.copy()
+        h.update(body)
+        return h.digest()
+
+    def verify(self, auth_header: str | None, body: BodyBuffer) -> bool:
         """Verify the HMAC signature from the Authorization header.
 
         Args:
             auth_header: The Authorization header value (e.g., "HMAC abc123...")
-            body: Raw request body bytes
+            body: Raw request body (bytes, bytearray or memoryview)
 
         Returns:
             True if signature is valid
@@ -97,11 +99,18 @@ class HMACVerifier:
             )
             raise HMACVerificationError("Invalid Authorization header format")
 
-        provided_signature = parts[1]
-        computed_signature = self._compute_signature(body)
+        # Compare raw digests rather than re-encoding ours to Base64
+        try:
+            provided_digest = base64.b64decode(parts[1], validate=True)
+        except ValueError as e:
+            logger.warning(
+                "hmac_verification_failed",
+                reason="invalid_signature_encoding",
+            )
+            raise HMACVerificationError("Invalid HMAC signature") from e
 
         # Use constant-time comparison to prevent timing attacks
-        if not hmac.compare_digest(provided_signature, computed_signature):
+        if not hmac.compare_digest(provided_digest, self._compute_digest(body)):
             logger.warning(
                 "hmac_verification_failed",
                 reason="signature_mismatch",
@@ -116,14 +125,25 @@ class HMACVerifier:
         return bool(self._secret_bytes)
 
 
-def create_verifier(secret: str | None) -> HMACVerifier | None:
+@lru_cache(maxsize=4)
+def create_verifier(secret: str | None, strict: bool = False) -> HMACVerifier | None:
     """Create an HMAC verifier if secret is provided.
 
+    Results are cached per secret, so repeated app initialization reuses
+    the same (stateless) verifier instead of re-decoding the secret. A
+    malformed secret yields a cached None (logged once) unless strict is
+    set; lru_cache does not cache exceptions, so strict callers should
+    check once at startup rather than per request.
+
     Args:
         secret: Base64-encoded HMAC secret, or None
+        strict: Raise on a malformed secret instead of disabling verification
 
     Returns:
         HMACVerifier instance or None if no secret provided
+
+    Raises:
+        ValueError: If strict is set and the secret is not valid Base64
     """
     # Check for empty or placeholder values
     if not secret or secret.upper() in ("DISABLED", "NONE", "OFF", "FALSE"):
@@ -137,4 +157,6 @@ def create_verifier(secret: str | None) -> HMACVerifier | None:
         return HMACVerifier(secret)
     except ValueError as e:
         logger.error("hmac_verifier_creation_failed", error=str(e))
+        if strict:
+            raise
         return None
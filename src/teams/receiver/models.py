@@ -9,8 +9,13 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import orjson
 
-@dataclass
+# Sentinel for memoized values that may legitimately be None
+_UNSET: Any = object()
+
+
+@dataclass(slots=True, frozen=True)
 class TeamsUser:
     """Represents a Teams user.
 
@@ -34,7 +39,7 @@ class TeamsUser:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TeamsConversation:
     """Represents a Teams conversation context.
 
@@ -61,7 +66,7 @@ class TeamsConversation:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TeamsMention:
     """Represents a mention in a Teams message.
 
@@ -86,7 +91,7 @@ class TeamsMention:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TeamsMessage:
     """Represents an incoming message from Teams Outgoing Webhook.
 
@@ -116,31 +121,36 @@ class TeamsMessage:
     mentions: list[TeamsMention] = field(default_factory=list)
     reply_to_id: str | None = None
 
+    # Memoized results of get_clean_text/get_command, derived from text; the
+    # instance is frozen so they cannot go stale, and are set via object.__setattr__
+    _clean_text: str | None = field(default=None, init=False, repr=False, compare=False)
+    _command: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+
     # Pattern to match @mentions like <at>Bot Name</at>
     MENTION_PATTERN = re.compile(r"<at>[^<]+</at>\s*")
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TeamsMessage":
         """Create from Teams webhook payload."""
-        # Parse timestamp
+        # Parse timestamp (fromisoformat accepts the trailing "Z" on 3.11+)
         ts = None
-        if data.get("timestamp"):
+        ts_raw = data.get("timestamp")
+        if ts_raw:
             try:
-                ts_str = data["timestamp"].replace("Z", "+00:00")
-                ts = datetime.fromisoformat(ts_str)
+                ts = datetime.fromisoformat(ts_raw)
             except (ValueError, TypeError):
                 pass
 
         # Parse mentions from entities
-        mentions = []
-        for entity in data.get("entities", []):
-            if entity.get("type") == "mention":
-                mentions.append(TeamsMention.from_dict(entity))
+        mentions = [
+            TeamsMention.from_dict(entity)
+            for entity in data.get("entities", ())
+            if entity.get("type") == "mention"
+        ]
 
         # Parse recipient if present
-        recipient = None
-        if data.get("recipient"):
-            recipient = TeamsUser.from_dict(data["recipient"])
+        recipient_data = data.get("recipient")
+        recipient = TeamsUser.from_dict(recipient_data) if recipient_data else None
 
         return cls(
             id=data.get("id", ""),
@@ -159,11 +169,29 @@ class TeamsMessage:
     def get_clean_text(self) -> str:
         """Get message text with @mentions removed.
 
+        The result is computed once and cached on the instance.
+
         Returns:
             The message text without @mention tags, stripped of whitespace
         """
-        clean = self.MENTION_PATTERN.sub("", self.text)
-        return clean.strip()
+        if self._clean_text is None:
+            text = self.text
+            # Direct messages carry no <at> tags; skip the regex engine entirely
+            if "<at>" not in text:
+                object.__setattr__(self, "_clean_text", text.strip())
+                return self._clean_text
+
+            # Webhook messages almost always open with the single bot mention
+            # ("<at>Bot</at> ..."); slice it off instead of running the regex
+            if text.startswith("<at>"):
+                end = text.find("</at>", 4)
+                rest = text[end + 5 :]
+                if end > 4 and "<" not in text[4:end] and "<at>" not in rest:
+                    object.__setattr__(self, "_clean_text", rest.strip())
+                    return self._clean_text
+
+            object.__setattr__(self, "_clean_text", self.MENTION_PATTERN.sub("", text).strip())
+        return self._clean_text
 
     def is_command(self) -> bool:
         """Check if the message is a command (starts with /).
@@ -171,6 +199,12 @@ class TeamsMessage:
         Returns:
             True if the clean text starts with /
         """
+        if self._clean_text is None:
+            # Unless the text opens with a tag, its first character survives
+            # mention removal, so the answer is known without cleaning
+            head = self.text.lstrip()[:1]
+            if head != "<":
+                return head == "/"
         return self.get_clean_text().startswith("/")
 
     def get_command(self) -> tuple[str, str] | None:
@@ -179,14 +213,26 @@ class TeamsMessage:
         Returns:
             Tuple of (command, args) or None if not a command
         """
+        if self._command is not _UNSET:
+            return self._command
+
         clean = self.get_clean_text()
         if not clean.startswith("/"):
+            object.__setattr__(self, "_command", None)
             return None
 
-        parts = clean.split(maxsplit=1)
-        command = parts[0][1:].lower()  # Remove leading /
-        args = parts[1] if len(parts) > 1 else ""
-        return (command, args)
+        sp = clean.find(" ")
+        head = clean if sp < 0 else clean[:sp]
+        if head.isprintable():
+            # No tab/newline/other whitespace inside the command token
+            command = head[1:].lower()  # Remove leading /
+            args = "" if sp < 0 else clean[sp + 1 :].lstrip()
+        else:
+            parts = clean.split(maxsplit=1)
+            command = parts[0][1:].lower()
+            args = parts[1] if len(parts) > 1 else ""
+        object.__setattr__(self, "_command", (command, args))
+        return self._command
 
     def get_user_identifier(self) -> str:
         """Get a unique identifier for the user.
@@ -222,7 +268,7 @@ class TeamsMessage:
         return self.reply_to_id is not None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TeamsResponse:
     """Response to send back to Teams.
 
@@ -250,3 +296,7 @@ class TeamsResponse:
                 ],
             }
         return {"type": "message", "text": self.text}
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the Teams response format directly to JSON bytes."""
+        return orjson.dumps(self.to_dict())
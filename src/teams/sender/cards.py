@@ -4,8 +4,54 @@ Adaptive Card Builder for Microsoft Teams.
 Builds Adaptive Cards following the 1.4 schema.
 """
 
-from datetime import datetime
-from typing import Any, Callable, Optional
+import time
+from typing import Any, Optional
+
+import orjson
+
+# Constant parts of every card, built once and merged per call
+_CARD_ENVELOPE: dict[str, Any] = {
+    "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
+    "type": "AdaptiveCard",
+    "version": "1.4",
+}
+_SUBTLE_STYLE: dict[str, Any] = {"size": "Small", "isSubtle": True}
+
+
+# (epoch second, formatted local time) of the last timestamp rendered
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _now_str() -> str:
+    """Current local time as 'YYYY-MM-DD HH:MM:SS', formatted once per second."""
+    global _ts_cache
+
+    second = int(time.time())
+    cached_second, cached_text = _ts_cache
+    if second != cached_second:
+        cached_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        _ts_cache = (second, cached_text)
+    return cached_text
+
+
+def _card(body: list[dict[str, Any]]) -> dict[str, Any]:
+    """Wrap a body in the Adaptive Card envelope."""
+    return {**_CARD_ENVELOPE, "body": body}
+
+
+def _text(text: str) -> dict[str, Any]:
+    """Wrapping TextBlock."""
+    return {"type": "TextBlock", "text": text, "wrap": True}
+
+
+def _title(text: str, size: str) -> dict[str, Any]:
+    """Bold wrapping TextBlock used for card titles."""
+    return {"type": "TextBlock", "text": text, "weight": "Bolder", "size": size, "wrap": True}
+
+
+def _subtle_text(text: str) -> dict[str, Any]:
+    """Small, subtle TextBlock used for sources and timestamps."""
+    return {"type": "TextBlock", "text": text, **_SUBTLE_STYLE}
 
 
 class AdaptiveCardBuilder:
@@ -22,19 +68,22 @@ class AdaptiveCardBuilder:
         Other actions (submit, execute, etc.) will not work.
     """
 
-    PRIORITY_COLORS = {
-        "low": "good",  # Green
-        "medium": "accent",  # Blue
-        "high": "warning",  # Yellow
-        "critical": "attention",  # Red
-    }
+    __slots__ = ()
 
-    PRIORITY_ICONS = {
-        "low": "ℹ️",
-        "medium": "📢",
-        "high": "⚠️",
-        "critical": "🚨",
+    # priority -> (icon, container style)
+    PRIORITY_STYLES = {
+        "low": ("ℹ️", "good"),  # Green
+        "medium": ("📢", "accent"),  # Blue
+        "high": ("⚠️", "warning"),  # Yellow
+        "critical": ("🚨", "attention"),  # Red
     }
+    DEFAULT_STYLE = ("📢", "accent")
+
+    PRIORITY_ICONS = {priority: style[0] for priority, style in PRIORITY_STYLES.items()}
+    PRIORITY_COLORS = {priority: style[1] for priority, style in PRIORITY_STYLES.items()}
+
+    # Keyword options build() accepts besides title, message and priority
+    OPTIONS = frozenset({"source", "action_url", "action_title", "footer", "data", "columns"})
 
     def build(
         self,
@@ -42,7 +91,13 @@ class AdaptiveCardBuilder:
         title: str,
         message: str,
         priority: str = "medium",
-        **kwargs: Any,
+        *,
+        source: Optional[str] = None,
+        action_url: Optional[str] = None,
+        action_title: str = "Ver detalles",
+        footer: Optional[str] = None,
+        data: Optional[dict] = None,
+        columns: Optional[list] = None,
     ) -> dict:
         """
         Build a card by type.
@@ -52,22 +107,54 @@ class AdaptiveCardBuilder:
             title: Card title
             message: Main message text
             priority: Priority level (low, medium, high, critical)
-            **kwargs: Additional parameters for specific card types
+            source: Alert source system
+            action_url: Alert action button URL
+            action_title: Alert action button text
+            footer: Info card footer text
+            data: Report key-value pairs
+            columns: Report column definitions
 
         Returns:
             Adaptive Card dictionary
+
+        Raises:
+            ValueError: If card_type is unknown
+            TypeError: If an option outside OPTIONS is passed
         """
-        builders: dict[str, Callable[..., dict[str, Any]]] = {
-            "alert": self.build_alert_card,
-            "info": self.build_info_card,
-            "report": self.build_report_card,
-        }
+        if card_type == "alert":
+            return self.build_alert_card(title, message, priority, source, action_url, action_title)
+        if card_type == "info":
+            return self.build_info_card(title, message, priority, footer)
+        if card_type == "report":
+            return self.build_report_card(title, message, priority, data, columns)
 
-        builder = builders.get(card_type)
-        if not builder:
-            raise ValueError(f"Unknown card type: {card_type}")
+        raise ValueError(f"Unknown card type: {card_type}")
+
+    def build_bytes(
+        self,
+        card_type: str,
+        title: str,
+        message: str,
+        priority: str = "medium",
+        **options: Any,
+    ) -> bytes:
+        """
+        Build a card by type and return it JSON-encoded.
+
+        The result can be passed straight to WebhookSender.send_card,
+        which embeds it without decoding.
+
+        Args:
+            card_type: One of "alert", "info", "report"
+            title: Card title
+            message: Main message text
+            priority: Priority level (low, medium, high, critical)
+            **options: Card options accepted by build()
 
-        return builder(title=title, message=message, priority=priority, **kwargs)
+        Returns:
+            Adaptive Card as UTF-8 JSON bytes
+        """
+        return orjson.dumps(self.build(card_type, title, message, priority, **options))
 
     def build_alert_card(
         self,
@@ -77,7 +164,6 @@ class AdaptiveCardBuilder:
         source: Optional[str] = None,
         action_url: Optional[str] = None,
         action_title: str = "Ver detalles",
-        **kwargs: Any,
     ) -> dict:
         """
         Build an alert card with priority styling.
@@ -93,57 +179,25 @@ class AdaptiveCardBuilder:
         Returns:
             Adaptive Card dictionary
         """
-        icon = self.PRIORITY_ICONS.get(priority, "📢")
-        color = self.PRIORITY_COLORS.get(priority, "accent")
+        icon, color = self.PRIORITY_STYLES.get(priority, self.DEFAULT_STYLE)
 
         body = [
             {
                 "type": "Container",
                 "style": color,
-                "items": [
-                    {
-                        "type": "TextBlock",
-                        "text": f"{icon} {title}",
-                        "weight": "Bolder",
-                        "size": "Large",
-                        "wrap": True,
-                    }
-                ],
-            },
-            {
-                "type": "TextBlock",
-                "text": message,
-                "wrap": True,
+                "items": [_title(f"{icon} {title}", "Large")],
             },
+            _text(message),
         ]
 
         # Add source if provided
         if source:
-            body.append(
-                {
-                    "type": "TextBlock",
-                    "text": f"Fuente: {source}",
-                    "size": "Small",
-                    "isSubtle": True,
-                }
-            )
+            body.append(_subtle_text(f"Fuente: {source}"))
 
         # Add timestamp
-        body.append(
-            {
-                "type": "TextBlock",
-                "text": f"_{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}_",
-                "size": "Small",
-                "isSubtle": True,
-            }
-        )
-
-        card = {
-            "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-            "type": "AdaptiveCard",
-            "version": "1.4",
-            "body": body,
-        }
+        body.append(_subtle_text(f"_{_now_str()}_"))
+
+        card = _card(body)
 
         # Add action button if URL provided
         if action_url:
@@ -163,7 +217,6 @@ class AdaptiveCardBuilder:
         message: str,
         priority: str = "medium",
         footer: Optional[str] = None,
-        **kwargs: Any,
     ) -> dict:
         """
         Build an informational card.
@@ -179,38 +232,12 @@ class AdaptiveCardBuilder:
         """
         icon = self.PRIORITY_ICONS.get(priority, "ℹ️")
 
-        body = [
-            {
-                "type": "TextBlock",
-                "text": f"{icon} {title}",
-                "weight": "Bolder",
-                "size": "Medium",
-                "wrap": True,
-            },
-            {
-                "type": "TextBlock",
-                "text": message,
-                "wrap": True,
-            },
-        ]
+        body = [_title(f"{icon} {title}", "Medium"), _text(message)]
 
         if footer:
-            body.append(
-                {
-                    "type": "TextBlock",
-                    "text": footer,
-                    "size": "Small",
-                    "isSubtle": True,
-                    "wrap": True,
-                }
-            )
+            body.append({**_subtle_text(footer), "wrap": True})
 
-        return {
-            "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-            "type": "AdaptiveCard",
-            "version": "1.4",
-            "body": body,
-        }
+        return _card(body)
 
     def build_report_card(
         self,
@@ -219,7 +246,6 @@ class AdaptiveCardBuilder:
         priority: str = "medium",
         data: Optional[dict] = None,
         columns: Optional[list] = None,
-        **kwargs: Any,
     ) -> dict:
         """
         Build a report card with data table.
@@ -236,24 +262,18 @@ class AdaptiveCardBuilder:
         """
         icon = self.PRIORITY_ICONS.get(priority, "📊")
 
-        body = [
-            {
-                "type": "TextBlock",
-                "text": f"{icon} {title}",
-                "weight": "Bolder",
-                "size": "Medium",
-                "wrap": True,
-            },
-            {
-                "type": "TextBlock",
-                "text": message,
-                "wrap": True,
-            },
-        ]
+        body = [_title(f"{icon} {title}", "Medium"), _text(message)]
 
         # Add data as fact set
         if data:
-            facts = [{"title": str(k), "value": str(v)} for k, v in data.items()]
+            # Report data is mostly str already; only convert the rest
+            facts = [
+                {
+                    "title": k if type(k) is str else str(k),
+                    "value": v if type(v) is str else str(v),
+                }
+                for k, v in data.items()
+            ]
             body.append(
                 {
                     "type": "FactSet",
@@ -262,18 +282,6 @@ class AdaptiveCardBuilder:
             )
 
         # Add timestamp
-        body.append(
-            {
-                "type": "TextBlock",
-                "text": f"Generado: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                "size": "Small",
-                "isSubtle": True,
-            }
-        )
-
-        return {
-            "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-            "type": "AdaptiveCard",
-            "version": "1.4",
-            "body": body,
-        }
+        body.append(_subtle_text(f"Generado: {_now_str()}"))
+
+        return _card(body)
@@ -5,16 +5,94 @@ Sends messages to Teams channels via Incoming Webhooks.
 """
 
 import asyncio
+import random
+import time
+import weakref
 from typing import Optional
+from urllib.parse import urlsplit
 
 import httpx
+import orjson
 import structlog
+from structlog.typing import FilteringBoundLogger
 
 from ...core.exceptions import TeamsError
 from .base import TeamsSender
 
 logger = structlog.get_logger()
 
+# Connection pool sizing for webhook hosts; with HTTP/2 most sends share one
+# multiplexed connection, so keepalive mainly spares repeated TLS handshakes
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+CONNECT_TIMEOUT = 5.0
+# Message envelope around an encoded card: HEAD + card JSON + TAIL
+_ENVELOPE_HEAD = (
+    b'{"type":"message","attachments":'
+    b'[{"contentType":"application/vnd.microsoft.card.adaptive","content":'
+)
+_ENVELOPE_TAIL = b"}]}"
+# Text message: HEAD + JSON string + TAIL
+_TEXT_HEAD = b'{"text":'
+_TEXT_TAIL = b"}"
+# Upper bound for a single backoff sleep between retries
+MAX_RETRY_DELAY = 30.0
+# Teams rejects webhook messages above ~28 KB with 413; checked before sending
+MAX_PAYLOAD_BYTES = 28_000
+# Bytes of an error response body kept for logs and TeamsError messages
+ERROR_BODY_LIMIT = 200
+# Webhooks a sender keeps per-URL state for; senders normally post to a small
+# fixed set of channels, and past this the oldest entry is evicted
+MAX_TRACKED_WEBHOOKS = 64
+# Leading path segments that identify a webhook's connector, e.g.
+# /webhookb2/{group}@{tenant}/IncomingWebhook/{connector} or
+# /workflows/{id}/triggers/manual; trailing ids and signatures are ignored
+_BUCKET_PATH_SEGMENTS = 4
+
+# Clients shared by senders created with shared_client=True, per event loop
+# and timeout, so short-lived senders reuse warm connections
+_LoopClients = dict[float, httpx.AsyncClient]
+_shared_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Retryable transport failures -> (log event, TeamsError label); subclasses
+# such as httpx.ReadTimeout resolve through their MRO
+_TRANSPORT_ERRORS: dict[type[Exception], tuple[str, str]] = {
+    httpx.TimeoutException: ("teams_timeout", "Timeout"),
+    httpx.ConnectError: ("teams_connection_error", "Connection error"),
+}
+
+
+def _transport_error_kind(exc: Exception) -> Optional[tuple[str, str]]:
+    """Look up the log event and label for a transport error, if known."""
+    for cls in type(exc).__mro__:
+        kind = _TRANSPORT_ERRORS.get(cls)
+        if kind is not None:
+            return kind
+    return None
+
+
+def _bucket_key(webhook_url: str) -> str:
+    """Key a webhook's rate-limit bucket by host and connector path prefix."""
+    parts = urlsplit(webhook_url)
+    segments = parts.path.strip("/").split("/", _BUCKET_PATH_SEGMENTS)
+    return parts.netloc.lower() + "/" + "/".join(segments[:_BUCKET_PATH_SEGMENTS])
+
+
+def _create_client(timeout: float) -> httpx.AsyncClient:
+    """Create an HTTP/2 client configured for Teams webhooks."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=POOL_LIMITS,
+        timeout=httpx.Timeout(timeout, connect=min(timeout, CONNECT_TIMEOUT)),
+        headers={"Content-Type": "application/json"},
+    )
+
 
 class WebhookSender(TeamsSender):
     """
@@ -23,8 +101,10 @@ class WebhookSender(TeamsSender):
     Features:
     - Simple text messages
     - Adaptive Cards
-    - Retry logic with exponential backoff
+    - Retry logic with jittered exponential backoff
     - Timeout handling
+    - Client-side rate limiting per webhook, on by default (1 request/s
+      with bursts of 4); pass rate_limit=None to disable
 
     Usage:
         sender = WebhookSender()
@@ -37,6 +117,9 @@ class WebhookSender(TeamsSender):
         timeout: float = 30.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        shared_client: bool = False,
+        rate_limit: Optional[float] = 1.0,
+        rate_burst: int = 4,
     ):
         """
         Initialize the webhook sender.
@@ -44,22 +127,89 @@ class WebhookSender(TeamsSender):
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
-            retry_delay: Initial delay between retries (exponential backoff)
+            retry_delay: Minimum delay between retries (jittered exponential backoff)
+            shared_client: Use the event loop's shared HTTP client instead of
+                a private one. close() then leaves the client open; call
+                WebhookSender.shutdown() on application exit.
+            rate_limit: Sustained requests per second allowed per webhook
+                (token bucket); None disables client-side throttling
+            rate_burst: Requests a webhook may receive back-to-back
+
+        Raises:
+            ValueError: If rate_limit is not positive or rate_burst is below 1
         """
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError(f"rate_limit must be positive or None, got {rate_limit}")
+        if rate_burst < 1:
+            raise ValueError(f"rate_burst must be at least 1, got {rate_burst}")
+
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.shared_client = shared_client
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
         self._client: Optional[httpx.AsyncClient] = None
+        # webhook (see _bucket_key) -> (tokens, last refill monotonic time),
+        # insertion-ordered and capped at MAX_TRACKED_WEBHOOKS
+        self._buckets: dict[str, tuple[float, float]] = {}
+        # webhook URL -> logger bound with its preview, built on first send
+        # (insertion-ordered, capped at MAX_TRACKED_WEBHOOKS)
+        self._log_by_url: dict[str, FilteringBoundLogger] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout),
-                headers={"Content-Type": "application/json"},
-            )
+            if self.shared_client:
+                loop_clients = _shared_clients.setdefault(asyncio.get_running_loop(), {})
+                client = loop_clients.get(self.timeout)
+                if client is None or client.is_closed:
+                    client = loop_clients[self.timeout] = _create_client(self.timeout)
+                self._client = client
+            else:
+                self._client = _create_client(self.timeout)
         return self._client
 
+    async def _acquire(self, webhook_url: str, deadline: Optional[float] = None) -> bool:
+        """Wait for a rate-limit token for the webhook.
+
+        Tokens may go negative: each caller reserves its slot immediately
+        and sleeps until the bucket would have refilled to it, so
+        concurrent sends to one webhook are spaced out in arrival order.
+
+        Args:
+            webhook_url: The webhook about to be posted to
+            deadline: time.monotonic() value the wait must not run past
+
+        Returns:
+            False, without reserving a slot or sleeping, if the wait would
+            run past the deadline; True once the token is acquired
+        """
+        if self.rate_limit is None:
+            return True
+
+        key = _bucket_key(webhook_url)
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= MAX_TRACKED_WEBHOOKS:
+                del self._buckets[next(iter(self._buckets))]
+            bucket = (float(self.rate_burst), now)
+        tokens, last = bucket
+        tokens = min(float(self.rate_burst), tokens + (now - last) * self.rate_limit) - 1
+        wait = -tokens / self.rate_limit if tokens < 0 else 0.0
+        if deadline is not None and now + wait > deadline:
+            return False
+        self._buckets[key] = (tokens, now)
+        if wait:
+            await asyncio.sleep(wait)
+        return True
+
+    def _drain(self, webhook_url: str) -> None:
+        """Empty the webhook's bucket after the server reports rate limiting."""
+        if self.rate_limit is not None:
+            self._buckets[_bucket_key(webhook_url)] = (0.0, time.monotonic())
+
     async def send_text(self, webhook_url: str, text: str) -> bool:
         """
         Send a simple text message to Teams.
@@ -71,16 +221,17 @@ class WebhookSender(TeamsSender):
         Returns:
             True if sent successfully
         """
-        payload = {"text": text}
-        return await self._post_with_retry(webhook_url, payload)
+        content = _TEXT_HEAD + orjson.dumps(text) + _TEXT_TAIL
+        return await self._post_with_retry(webhook_url, content)
 
-    async def send_card(self, webhook_url: str, card: dict) -> bool:
+    async def send_card(self, webhook_url: str, card: dict | bytes) -> bool:
         """
         Send an Adaptive Card to Teams.
 
         Args:
             webhook_url: The Incoming Webhook URL
-            card: Adaptive Card content
+            card: Adaptive Card content, as a dict or JSON-encoded bytes
+                (e.g. from AdaptiveCardBuilder.build_bytes)
 
         Returns:
             True if sent successfully
@@ -89,111 +240,190 @@ class WebhookSender(TeamsSender):
             Card must follow Adaptive Cards schema v1.4
             Only 'openURL' action is supported
         """
-        payload = {
-            "type": "message",
-            "attachments": [
-                {
-                    "contentType": "application/vnd.microsoft.card.adaptive",
-                    "content": card,
-                }
-            ],
-        }
-        return await self._post_with_retry(webhook_url, payload)
-
-    async def _post_with_retry(self, webhook_url: str, payload: dict) -> bool:
+        return await self._post_with_retry(webhook_url, self._encode_card(card))
+
+    async def send_cards(
+        self,
+        webhook_urls: list[str],
+        card: dict | bytes,
+        concurrency: int = 8,
+    ) -> list[bool | BaseException]:
+        """
+        Send the same Adaptive Card to several webhooks concurrently.
+
+        The payload is encoded once and at most ``concurrency`` posts
+        (each with its own retries) are in flight at a time.
+
+        Args:
+            webhook_urls: Incoming Webhook URLs to deliver to
+            card: Adaptive Card content, as a dict or JSON-encoded bytes
+            concurrency: Maximum simultaneous deliveries
+
+        Returns:
+            One entry per URL, in order: True on success or the raised exception
+        """
+        content = self._encode_card(card)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _send(url: str) -> bool:
+            async with semaphore:
+                return await self._post_with_retry(url, content)
+
+        return await asyncio.gather(
+            *(_send(url) for url in webhook_urls),
+            return_exceptions=True,
+        )
+
+    @staticmethod
+    def _encode_card(card: dict | bytes) -> bytes:
+        """Wrap a card in the message envelope and encode it to JSON bytes.
+
+        Only the card itself is encoded; the constant envelope is joined
+        around it as pre-built bytes.
+        """
+        if not isinstance(card, bytes):
+            card = orjson.dumps(card)
+        return _ENVELOPE_HEAD + card + _ENVELOPE_TAIL
+
+    async def _post_with_retry(self, webhook_url: str, content: bytes) -> bool:
         """
-        POST to webhook with retry and exponential backoff.
+        POST to webhook with retry and jittered exponential backoff.
+
+        The body is encoded once by the caller and reused on every attempt.
+        Retries stop early once the next backoff (or a 429 Retry-After wait)
+        would end after the overall deadline of ``timeout * max_retries``
+        seconds; the error then reports the attempts actually made.
 
         Args:
             webhook_url: Target URL
-            payload: JSON payload
+            content: JSON-encoded payload
 
         Returns:
             True if successful
 
         Raises:
-            TeamsError: If all retries fail
+            TeamsError: If the payload exceeds MAX_PAYLOAD_BYTES or all retries fail
         """
+        if len(content) > MAX_PAYLOAD_BYTES:
+            raise TeamsError(
+                f"Payload too large: {len(content)} bytes exceeds the "
+                f"{MAX_PAYLOAD_BYTES} byte Teams webhook limit"
+            )
+
         client = await self._get_client()
+        log = self._log_by_url.get(webhook_url)
+        if log is None:
+            if len(self._log_by_url) >= MAX_TRACKED_WEBHOOKS:
+                del self._log_by_url[next(iter(self._log_by_url))]
+            log = self._log_by_url[webhook_url] = logger.bind(url_preview=webhook_url[:50])
         last_error: Optional[str] = None
         delay = self.retry_delay
+        deadline = time.monotonic() + self.timeout * self.max_retries
+        deadline_hit = False
+        attempt = 0
 
         for attempt in range(1, self.max_retries + 1):
             try:
-                response = await client.post(webhook_url, json=payload)
+                if not await self._acquire(webhook_url, deadline):
+                    # The throttle wait alone would outlast the deadline, so
+                    # this attempt is never made
+                    attempt -= 1
+                    last_error = last_error or "client-side rate limit wait exceeds the deadline"
+                    deadline_hit = True
+                    break
+                response = await client.post(webhook_url, content=content)
+                status = response.status_code
 
-                if response.status_code == 200:
-                    logger.info(
-                        "teams_message_sent",
-                        attempt=attempt,
-                        url_preview=webhook_url[:50],
-                    )
+                if status == 200:
+                    log.info("teams_message_sent", attempt=attempt)
                     return True
 
                 # Handle specific error codes
-                if response.status_code == 429:
-                    # Rate limited - wait longer
+                if status == 429:
+                    # Rate limited - wait longer and stop bursting to this webhook
+                    self._drain(webhook_url)
                     retry_after = int(response.headers.get("Retry-After", delay * 2))
-                    logger.warning(
+                    last_error = f"HTTP 429: rate limited (Retry-After {retry_after}s)"
+                    log.warning(
                         "teams_rate_limited",
                         attempt=attempt,
                         retry_after=retry_after,
                     )
-                    await asyncio.sleep(retry_after)
+                    if attempt < self.max_retries:
+                        if time.monotonic() + retry_after > deadline:
+                            deadline_hit = True
+                            break
+                        await asyncio.sleep(retry_after)
                     continue
 
-                if response.status_code >= 400 and response.status_code < 500:
+                if 400 <= status < 500:
                     # Client error - don't retry
-                    last_error = f"HTTP {response.status_code}: {response.text}"
-                    logger.error(
+                    body = self._error_body(response)
+                    last_error = f"HTTP {status}: {body}"
+                    log.error(
                         "teams_client_error",
-                        status=response.status_code,
-                        response=response.text[:200],
+                        status=status,
+                        response=body,
                     )
                     break
 
                 # Server error - retry
-                last_error = f"HTTP {response.status_code}: {response.text}"
-                logger.warning(
+                last_error = f"HTTP {status}: {self._error_body(response)}"
+                log.warning(
                     "teams_send_retry",
                     attempt=attempt,
-                    status=response.status_code,
-                )
-
-            except httpx.TimeoutException as e:
-                last_error = f"Timeout: {e}"
-                logger.warning(
-                    "teams_timeout",
-                    attempt=attempt,
-                    timeout=self.timeout,
-                )
-
-            except httpx.ConnectError as e:
-                last_error = f"Connection error: {e}"
-                logger.warning(
-                    "teams_connection_error",
-                    attempt=attempt,
-                    error=str(e),
+                    status=status,
                 )
 
             except Exception as e:
-                last_error = f"Unexpected error: {e}"
-                logger.error(
-                    "teams_unexpected_error",
-                    attempt=attempt,
-                    error=str(e),
-                )
-
-            # Wait before retry with exponential backoff
+                kind = _transport_error_kind(e)
+                if kind is None:
+                    last_error = f"Unexpected error: {e}"
+                    log.error("teams_unexpected_error", attempt=attempt, error=str(e))
+                else:
+                    event, label = kind
+                    last_error = f"{label}: {e}"
+                    log.warning(event, attempt=attempt, error=str(e))
+
+            # Wait before retry; decorrelated jitter keeps concurrent senders
+            # that failed together from retrying in lockstep
             if attempt < self.max_retries:
+                spread = max(0.0, min(MAX_RETRY_DELAY, delay * 3) - self.retry_delay)
+                delay = self.retry_delay + random.random() * spread
+                if time.monotonic() + delay > deadline:
+                    deadline_hit = True
+                    break
                 await asyncio.sleep(delay)
-                delay *= 2  # Exponential backoff
 
-        raise TeamsError(f"Failed to send after {self.max_retries} attempts: {last_error}")
+        attempts = "attempt" if attempt == 1 else "attempts"
+        if deadline_hit:
+            raise TeamsError(
+                f"Failed to send after {attempt} {attempts}, "
+                f"stopped by the retry deadline: {last_error}"
+            )
+        raise TeamsError(f"Failed to send after {attempt} {attempts}: {last_error}")
+
+    @staticmethod
+    def _error_body(response: httpx.Response) -> str:
+        """Decode at most ERROR_BODY_LIMIT bytes of an error response body.
+
+        Success responses are never decoded; Teams only returns "1" there.
+        """
+        return response.content[:ERROR_BODY_LIMIT].decode("utf-8", "replace")
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client (only detaches from a shared client)."""
         if self._client is not None:
-            await self._client.aclose()
+            if not self.shared_client:
+                await self._client.aclose()
             self._client = None
             logger.debug("teams_sender_closed")
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the shared HTTP clients of the running event loop."""
+        loop_clients = _shared_clients.pop(asyncio.get_running_loop(), {})
+        for client in loop_clients.values():
+            await client.aclose()
+        if loop_clients:
+            logger.debug("teams_shared_clients_closed", count=len(loop_clients))
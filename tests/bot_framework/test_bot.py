@@ -157,6 +157,25 @@ class TestValerieBot:
         result = bot._remove_bot_mention("<at>Valerie</at> Hello", sample_activity)
         assert result == "Hello"
 
+    async def test_remove_bot_mention_ignores_other_mentions(self, bot, sample_activity):
+        """Test only the bot's mentions are removed, including repeated entities."""
+        bot_mention = MagicMock(
+            type="mention",
+            additional_properties={"mentioned": {"id": "bot-123"}, "text": "<at>Valerie</at>"},
+        )
+        sample_activity.entities = [
+            bot_mention,
+            MagicMock(
+                type="mention",
+                additional_properties={"mentioned": {"id": "user-1"}, "text": "<at>Ana</at>"},
+            ),
+            bot_mention,
+        ]
+        result = bot._remove_bot_mention(
+            "<at>Valerie</at> ask <at>Ana</at> <at>Valerie</at>", sample_activity
+        )
+        assert result == "ask <at>Ana</at>"
+
 
 class TestValerieBotConversationUpdate:
     """Tests for conversation update handling."""
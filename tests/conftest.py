@@ -2,6 +2,11 @@
 Pytest common fixtures.
 """
 
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient as FastAPITestClient
 
@@ -9,6 +14,29 @@ from tests.mocks.mock_agent_server import app as agent_app
 from tests.mocks.mock_webhook_receiver import app as webhook_app
 
 
+@pytest.fixture(autouse=True)
+def auto_profile(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Profile each test with pyinstrument when PROFILE is set.
+
+    Reports are written to .profiles/<test name>.html. Without PROFILE the
+    fixture does nothing and pyinstrument need not be installed.
+    """
+    if not os.environ.get("PROFILE"):
+        yield
+        return
+
+    from pyinstrument import Profiler
+
+    profiler = Profiler(async_mode="enabled")
+    profiler.start()
+    yield
+    profiler.stop()
+
+    out_dir = Path(".profiles")
+    out_dir.mkdir(exist_ok=True)
+    (out_dir / f"{request.node.name.replace('/', '_')}.html").write_text(profiler.output_html())
+
+
 @pytest.fixture
 def mock_agent_url() -> str:
     """URL of the mock agent server."""
@@ -21,62 +49,70 @@ def mock_webhook_url() -> str:
     return "http://localhost:3000"
 
 
-@pytest.fixture
-def agent_test_client() -> FastAPITestClient:
-    """Sync test client for mock agent (no server needed)."""
-    return FastAPITestClient(agent_app)
+@pytest.fixture(scope="session")
+def agent_test_client() -> Iterator[FastAPITestClient]:
+    """Sync test client for mock agent (no server needed), shared by all tests."""
+    with FastAPITestClient(agent_app) as client:
+        yield client
 
 
-@pytest.fixture
-def webhook_test_client() -> FastAPITestClient:
-    """Sync test client for mock webhook (no server needed)."""
-    return FastAPITestClient(webhook_app)
+@pytest.fixture(scope="session")
+def webhook_test_client() -> Iterator[FastAPITestClient]:
+    """Sync test client for mock webhook (no server needed), shared by all tests."""
+    with FastAPITestClient(webhook_app) as client:
+        yield client
 
 
-@pytest.fixture
-def sample_query_request() -> dict:
-    """Sample request for /query endpoint."""
-    return {
-        "message": "Cual es la politica de vacaciones?",
-        "context": {
-            "platform": "test",
-            "user_id": "test-user",
-            "user_name": "Test User",
-        },
-    }
-
-
-@pytest.fixture
-def sample_teams_message() -> dict:
-    """Sample Teams message."""
-    return {
-        "type": "message",
-        "id": "test-msg-001",
-        "text": "<at>Bot</at> Hola, necesito ayuda",
-        "from": {
-            "id": "user-001",
-            "name": "Test User",
-        },
-        "conversation": {
-            "id": "conv-001",
-        },
-    }
-
-
-@pytest.fixture
-def sample_query_with_history() -> dict:
-    """Sample request with conversation history."""
-    return {
-        "message": "Y si no los uso todos?",
-        "context": {
-            "platform": "test",
-            "user_id": "test-user",
-        },
-        "conversation_history": [
-            {"role": "user", "content": "Cual es la politica de vacaciones?"},
-            {
-                "role": "assistant",
-                "content": "La politica de vacaciones permite 15 dias...",
+@pytest.fixture(scope="session")
+def sample_query_request() -> bytes:
+    """Sample request for /query endpoint, pre-serialized as JSON."""
+    return orjson.dumps(
+        {
+            "message": "Cual es la politica de vacaciones?",
+            "context": {
+                "platform": "test",
+                "user_id": "test-user",
+                "user_name": "Test User",
+            },
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_teams_message() -> bytes:
+    """Sample Teams message, pre-serialized as JSON."""
+    return orjson.dumps(
+        {
+            "type": "message",
+            "id": "test-msg-001",
+            "text": "<at>Bot</at> Hola, necesito ayuda",
+            "from": {
+                "id": "user-001",
+                "name": "Test User",
+            },
+            "conversation": {
+                "id": "conv-001",
+            },
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_query_with_history() -> bytes:
+    """Sample request with conversation history, pre-serialized as JSON."""
+    return orjson.dumps(
+        {
+            "message": "Y si no los uso todos?",
+            "context": {
+                "platform": "test",
+                "user_id": "test-user",
             },
-        ],
-    }
+            "conversation_history": [
+                {"role": "user", "content": "Cual es la politica de vacaciones?"},
+                {
+                    "role": "assistant",
+                    "content": "La politica de vacaciones permite 15 dias...",
+                },
+            ],
+        }
+    )
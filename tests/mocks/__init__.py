@@ -2,10 +2,23 @@
 Mock servers for testing.
 """
 
-from .mock_responses import DEFAULT_RESPONSE, KNOWLEDGE_BASE, get_response_for_query
+from .http import make_response, make_transport
+from .mock_responses import (
+    DEFAULT_RESPONSE,
+    KNOWLEDGE_BASE,
+    get_response_for_lowercase,
+    get_response_for_query,
+)
+from .signing import sign
+from .stubs import async_stub
 
 __all__ = [
     "KNOWLEDGE_BASE",
     "DEFAULT_RESPONSE",
     "get_response_for_query",
+    "get_response_for_lowercase",
+    "make_response",
+    "make_transport",
+    "async_stub",
+    "sign",
 ]
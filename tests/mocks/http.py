@@ -0,0 +1,60 @@
+"""
+Lightweight HTTP response stand-ins for unit tests.
+"""
+
+from collections.abc import Callable, Mapping
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import httpx
+
+Route = Callable[[httpx.Request], httpx.Response]
+
+
+def make_response(
+    status_code: int = 200,
+    json_body: Any = None,
+    content: bytes = b"",
+    headers: Optional[dict[str, str]] = None,
+) -> SimpleNamespace:
+    """
+    Build a fake httpx response without MagicMock's bookkeeping.
+
+    Args:
+        status_code: HTTP status code
+        json_body: Value returned by json()
+        content: Raw response body
+        headers: Response headers
+
+    Returns:
+        Object exposing status_code, content, headers, json() and a no-op
+        raise_for_status()
+    """
+    return SimpleNamespace(
+        status_code=status_code,
+        content=content,
+        headers=headers or {},
+        json=lambda: json_body,
+        raise_for_status=lambda: None,
+    )
+
+
+def make_transport(routes: Mapping[tuple[str, str], Route]) -> httpx.MockTransport:
+    """
+    Build an httpx transport that answers from a (method, path) route table.
+
+    The table is looked up on every request, so tests can share one client
+    and swap routes in and out. A route may raise an httpx exception to
+    simulate timeouts or connection failures.
+
+    Args:
+        routes: Maps (method, URL path) to a function returning the response
+
+    Returns:
+        MockTransport for httpx.AsyncClient(transport=...)
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return routes[(request.method, request.url.path)](request)
+
+    return httpx.MockTransport(handler)
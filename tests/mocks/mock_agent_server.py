@@ -10,10 +10,14 @@ Usage:
 """
 
 import asyncio
+import itertools
+import os
 import random
+import re
 import time
-import uuid
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
+from random import uniform as _uniform
 from typing import Any
 
 import structlog
@@ -21,7 +25,9 @@ import uvicorn
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
 
-from .mock_responses import get_response_for_query
+from src.core.config import settings
+
+from .mock_responses import get_response_for_lowercase, get_response_for_query
 
 logger = structlog.get_logger()
 
@@ -31,8 +37,15 @@ app = FastAPI(
     version="2.2.0",
 )
 
-# In-memory session storage
-_sessions: dict[str, dict[str, Any]] = {}
+# In-memory session storage, least recently used first; bounded so long
+# load tests with fresh session IDs don't grow the mock without limit
+MAX_SESSIONS = 10_000
+_sessions: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+# Session IDs: a counter plus a random suffix, with no OS entropy read per
+# request. Mock-only, not for production: these IDs are guessable.
+_session_counter = itertools.count()
+_rand = random.Random()
 
 
 # === Models (matching real API) ===
@@ -104,20 +117,35 @@ class HealthResponse(BaseModel):
     services: list[ServiceHealth] = []
 
 
+# Static dependency report for /health, validated once at import
+_HEALTH_SERVICES = [
+    ServiceHealth(name="knowledge_base", status="healthy", latency_ms=5.2),
+    ServiceHealth(name="agent_pipeline", status="healthy", latency_ms=12.1),
+]
+
+# Range of simulated agent latency, in seconds
+SIMULATED_LATENCY = (0.3, 1.5)
+
+# Simulated pipeline: (agent_name, display_name, share of processing time)
+_AGENT_PIPELINE = (
+    ("guardrails", "Guardrails", 0.1),
+    ("intent_classifier", "Intent Classifier", 0.2),
+    ("knowledge_retrieval", "Knowledge Retrieval", 0.5),
+    ("response_generator", "Response Generator", 0.2),
+)
+
+
 # === Endpoints ===
 
 
 @app.get("/health", response_model=HealthResponse)
 async def health() -> HealthResponse:
     """Health check endpoint."""
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="healthy",
         version="2.2.0-mock",
         timestamp=datetime.now(timezone.utc),
-        services=[
-            ServiceHealth(name="knowledge_base", status="healthy", latency_ms=5.2),
-            ServiceHealth(name="agent_pipeline", status="healthy", latency_ms=12.1),
-        ],
+        services=_HEALTH_SERVICES,
     )
 
 
@@ -144,68 +172,56 @@ async def chat(request: ChatRequest) -> ChatResponse:
     - Intent detection
     - Variable latency (0.3 - 1.5 seconds)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
+    received_at = datetime.now(timezone.utc)
 
     # Get or create session
-    session_id = request.session_id or str(uuid.uuid4())[:12]
-    if session_id not in _sessions:
-        _sessions[session_id] = {
-            "created_at": datetime.now(timezone.utc),
-            "messages": [],
+    session_id = request.session_id or f"{next(_session_counter):08x}{_rand.getrandbits(16):04x}"
+    session = _sessions.get(session_id)
+    if session is None:
+        session = _sessions[session_id] = {
+            "created_at": received_at,
+            "messages": deque(maxlen=settings.session_max_messages),
             "status": "active",
         }
-
-    session = _sessions[session_id]
+        if len(_sessions) > MAX_SESSIONS:
+            _sessions.popitem(last=False)
+    else:
+        _sessions.move_to_end(session_id)
 
     # Add user message to history
     session["messages"].append(
         {
             "role": "user",
             "content": request.message,
-            "timestamp": datetime.now(timezone.utc),
+            "timestamp": received_at,
         }
     )
-    session["last_activity"] = datetime.now(timezone.utc)
-
-    # Simulate latency (0.3 - 1.5 seconds)
-    delay = random.uniform(0.3, 1.5)
-    await asyncio.sleep(delay)
+    session["last_activity"] = received_at
 
-    # Get response from knowledge base
-    response_data = get_response_for_query(request.message)
+    await _simulate_latency()
 
-    # Detect intent
-    intent = _detect_intent(request.message)
+    # Lowercase once for the knowledge-base lookup and intent detection
+    message_lower = request.message.lower()
+    response_data = get_response_for_lowercase(message_lower)
+    intent = _detect_intent(message_lower)
     confidence = response_data.get("confidence", 0.85)
 
     # Simulate agent executions
-    processing_time = int((time.time() - start_time) * 1000)
+    processing_time = int((time.perf_counter() - start_time) * 1000)
     agents_executed = [
-        AgentExecution(
-            agent_name="guardrails",
-            display_name="Guardrails",
+        AgentExecution.model_construct(
+            agent_name=agent_name,
+            display_name=display_name,
             status="completed",
-            duration_ms=int(processing_time * 0.1),
-        ),
-        AgentExecution(
-            agent_name="intent_classifier",
-            display_name="Intent Classifier",
-            status="completed",
-            duration_ms=int(processing_time * 0.2),
-            output={"intent": intent, "confidence": confidence},
-        ),
-        AgentExecution(
-            agent_name="knowledge_retrieval",
-            display_name="Knowledge Retrieval",
-            status="completed",
-            duration_ms=int(processing_time * 0.5),
-        ),
-        AgentExecution(
-            agent_name="response_generator",
-            display_name="Response Generator",
-            status="completed",
-            duration_ms=int(processing_time * 0.2),
-        ),
+            duration_ms=int(processing_time * share),
+            output=(
+                {"intent": intent, "confidence": confidence}
+                if agent_name == "intent_classifier"
+                else {}
+            ),
+        )
+        for agent_name, display_name, share in _AGENT_PIPELINE
     ]
 
     # Add assistant message to history
@@ -240,12 +256,13 @@ async def chat(request: ChatRequest) -> ChatResponse:
 @app.get("/api/v1/sessions/{session_id}", response_model=SessionResponse)
 async def get_session(session_id: str) -> SessionResponse:
     """Get session details and history."""
-    if session_id not in _sessions:
+    session = _sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    session = _sessions[session_id]
+    # Stored history is trusted in-process data; skip re-validating it
     messages = [
-        Message(
+        Message.model_construct(
             role=m["role"],
             content=m["content"],
             timestamp=m["timestamp"],
@@ -253,7 +270,7 @@ async def get_session(session_id: str) -> SessionResponse:
         for m in session["messages"]
     ]
 
-    return SessionResponse(
+    return SessionResponse.model_construct(
         session_id=session_id,
         status=session.get("status", "active"),
         created_at=session["created_at"],
@@ -266,10 +283,9 @@ async def get_session(session_id: str) -> SessionResponse:
 @app.delete("/api/v1/sessions/{session_id}")
 async def delete_session(session_id: str) -> dict:
     """Delete a session."""
-    if session_id not in _sessions:
+    if _sessions.pop(session_id, None) is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    del _sessions[session_id]
     logger.info("session_deleted", session_id=session_id)
     return {"deleted": True, "session_id": session_id}
 
@@ -301,14 +317,12 @@ async def legacy_query(request: LegacyQueryRequest) -> LegacyQueryResponse:
 
     Use /api/v1/chat instead.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
-    # Simulate latency
-    delay = random.uniform(0.3, 1.5)
-    await asyncio.sleep(delay)
+    await _simulate_latency()
 
     response_data = get_response_for_query(request.message)
-    processing_time = int((time.time() - start_time) * 1000)
+    processing_time = int((time.perf_counter() - start_time) * 1000)
 
     return LegacyQueryResponse(
         text=response_data["text"],
@@ -321,22 +335,31 @@ async def legacy_query(request: LegacyQueryRequest) -> LegacyQueryResponse:
 # === Helper functions ===
 
 
-def _detect_intent(message: str) -> str:
-    """Detect the user's intent from the message."""
-    message_lower = message.lower()
-
-    if any(word in message_lower for word in ["supplier", "proveedor", "vendor"]):
-        return "supplier_search"
-    elif any(word in message_lower for word in ["certif", "nadcap", "as9100"]):
-        return "certification_check"
-    elif any(word in message_lower for word in ["risk", "riesgo", "quality", "calidad"]):
-        return "risk_assessment"
-    elif any(word in message_lower for word in ["hola", "hello", "hi", "hey"]):
-        return "greeting"
-    elif any(word in message_lower for word in ["help", "ayuda", "?"]):
-        return "help_request"
-    else:
-        return "general_query"
+async def _simulate_latency() -> None:
+    """Sleep for a random agent latency within SIMULATED_LATENCY seconds."""
+    await asyncio.sleep(_uniform(*SIMULATED_LATENCY))
+
+
+# Intent keywords in priority order, each compiled to one alternation so a
+# message is scanned once per intent by the regex engine
+_INTENT_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (intent, re.compile("|".join(map(re.escape, keywords))))
+    for intent, keywords in (
+        ("supplier_search", ["supplier", "proveedor", "vendor"]),
+        ("certification_check", ["certif", "nadcap", "as9100"]),
+        ("risk_assessment", ["risk", "riesgo", "quality", "calidad"]),
+        ("greeting", ["hola", "hello", "hi", "hey"]),
+        ("help_request", ["help", "ayuda", "?"]),
+    )
+)
+
+
+def _detect_intent(message_lower: str) -> str:
+    """Detect the user's intent from the lowercased message."""
+    for intent, pattern in _INTENT_PATTERNS:
+        if pattern.search(message_lower):
+            return intent
+    return "general_query"
 
 
 # === Main ===
@@ -360,4 +383,12 @@ if __name__ == "__main__":
     print("  Press Ctrl+C to stop")
     print("=" * 60)
     print()
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # uvicorn picks uvloop/httptools automatically when installed
+    # (uvicorn[standard] in requirements/dev.txt). MOCK_WORKERS > 1 needs
+    # the import string; sessions are per worker.
+    uvicorn.run(
+        "tests.mocks.mock_agent_server:app",
+        host="0.0.0.0",
+        port=8080,
+        workers=int(os.getenv("MOCK_WORKERS", "1")),
+    )
@@ -4,6 +4,8 @@ Predefined responses for the mock agent.
 Simulates a knowledge base with HR/company policy information.
 """
 
+import re
+
 KNOWLEDGE_BASE: dict[str, dict] = {
     "vacaciones": {
         "text": (
@@ -74,6 +76,11 @@ DEFAULT_RESPONSE: dict = {
 }
 
 
+# All keywords in one alternation, so a query is scanned once
+_KB_PATTERN = re.compile("|".join(map(re.escape, KNOWLEDGE_BASE)))
+_KB_PRIORITY = {keyword: i for i, keyword in enumerate(KNOWLEDGE_BASE)}
+
+
 def get_response_for_query(query: str) -> dict:
     """
     Search for a response in the knowledge base.
@@ -84,10 +91,24 @@ def get_response_for_query(query: str) -> dict:
     Returns:
         Dict with text, sources, confidence
     """
-    query_lower = query.lower()
+    return get_response_for_lowercase(query.lower())
+
+
+def get_response_for_lowercase(query_lower: str) -> dict:
+    """
+    Search the knowledge base with a query that is already lowercase.
 
-    for keyword, response in KNOWLEDGE_BASE.items():
-        if keyword in query_lower:
-            return response
+    Lets callers that lowercase the message for other checks reuse it.
+
+    Args:
+        query_lower: Lowercased query text
+
+    Returns:
+        Dict with text, sources, confidence
+    """
+    matches = _KB_PATTERN.findall(query_lower)
+    if not matches:
+        return DEFAULT_RESPONSE
 
-    return DEFAULT_RESPONSE
+    # Several topics mentioned: the earliest KNOWLEDGE_BASE entry wins
+    return KNOWLEDGE_BASE[min(matches, key=_KB_PRIORITY.__getitem__)]
@@ -8,12 +8,15 @@ Usage:
     # Runs on http://localhost:3000
 """
 
-from typing import Any, Optional
+import os
+from typing import Optional
 
 import structlog
 import uvicorn
 from fastapi import FastAPI, Request
-from pydantic import BaseModel
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 logger = structlog.get_logger()
 
@@ -46,17 +49,10 @@ class TeamsMessage(BaseModel):
     type: str = "message"
     id: str
     text: str
-    from_: Optional[TeamsUser] = None
+    from_: Optional[TeamsUser] = Field(default=None, alias="from")
     conversation: Optional[TeamsConversation] = None
 
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data: Any):
-        # Handle 'from' reserved keyword
-        if "from" in data:
-            data["from_"] = data.pop("from")
-        super().__init__(**data)
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class WebhookResponse(BaseModel):
@@ -66,6 +62,21 @@ class WebhookResponse(BaseModel):
     text: str
 
 
+# Static replies to mock commands, built once and shared across requests
+_COMMAND_RESPONSES: dict[str, WebhookResponse] = {
+    "/clear": WebhookResponse(text="Historial limpiado (mock)"),
+    "/history": WebhookResponse(text="No hay historial disponible (mock)"),
+    "/help": WebhookResponse(
+        text=(
+            "**Comandos disponibles:**\n\n"
+            "- `/clear` - Limpiar historial\n"
+            "- `/history` - Ver historial\n"
+            "- `/help` - Mostrar ayuda"
+        )
+    ),
+}
+
+
 # === Endpoints ===
 
 
@@ -75,28 +86,30 @@ async def health() -> dict:
     return {"status": "ok", "service": "mock-webhook"}
 
 
+@app.exception_handler(RequestValidationError)
+async def parse_error(request: Request, exc: RequestValidationError) -> JSONResponse:
+    """Answer unparseable messages the way Teams expects, not with a 422."""
+    logger.error("parse_error", error=str(exc.errors()))
+    return JSONResponse(WebhookResponse(text="Error parsing message").model_dump())
+
+
 @app.post("/webhook", response_model=WebhookResponse)
-async def webhook(request: Request) -> WebhookResponse:
+async def webhook(message: TeamsMessage) -> WebhookResponse:
     """
     Receive message from Teams.
 
+    The body is parsed and validated into TeamsMessage by FastAPI in one step.
+
     Simulates:
     - Message parsing
     - @mention removal
     - Command handling
     """
-    body = await request.json()
-
-    try:
-        message = TeamsMessage(**body)
-    except Exception as e:
-        logger.error("parse_error", error=str(e))
-        return WebhookResponse(text="Error parsing message")
-
     # Extract text without @mention
     text = message.text
-    if "</at>" in text:
-        text = text.split("</at>", 1)[1].strip()
+    mention_end = text.find("</at>")
+    if mention_end != -1:
+        text = text[mention_end + len("</at>") :].strip()
 
     user_name = message.from_.name if message.from_ else "Unknown"
 
@@ -110,21 +123,9 @@ async def webhook(request: Request) -> WebhookResponse:
     # Handle commands
     text_lower = text.lower().strip()
 
-    if text_lower == "/clear":
-        return WebhookResponse(text="Historial limpiado (mock)")
-
-    if text_lower == "/history":
-        return WebhookResponse(text="No hay historial disponible (mock)")
-
-    if text_lower == "/help":
-        return WebhookResponse(
-            text=(
-                "**Comandos disponibles:**\n\n"
-                "- `/clear` - Limpiar historial\n"
-                "- `/history` - Ver historial\n"
-                "- `/help` - Mostrar ayuda"
-            )
-        )
+    command_response = _COMMAND_RESPONSES.get(text_lower)
+    if command_response is not None:
+        return command_response
 
     # Default response
     return WebhookResponse(
@@ -148,4 +149,12 @@ if __name__ == "__main__":
     print("  Press Ctrl+C to stop")
     print("=" * 60)
     print()
-    uvicorn.run(app, host="0.0.0.0", port=3000)
+    # uvicorn picks uvloop/httptools automatically when installed
+    # (uvicorn[standard] in requirements/dev.txt). MOCK_WORKERS > 1 needs
+    # the import string.
+    uvicorn.run(
+        "tests.mocks.mock_webhook_receiver:app",
+        host="0.0.0.0",
+        port=3000,
+        workers=int(os.getenv("MOCK_WORKERS", "1")),
+    )
@@ -0,0 +1,27 @@
+"""
+Teams Outgoing Webhook signatures for tests.
+"""
+
+import base64
+import hashlib
+import hmac
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def sign(secret_b64: str, body: bytes) -> str:
+    """
+    Compute the Base64 HMAC-SHA256 signature Teams sends for a body.
+
+    Tests sign the same few (secret, body) pairs repeatedly, so results
+    are memoized.
+
+    Args:
+        secret_b64: Base64-encoded webhook secret
+        body: Raw request body
+
+    Returns:
+        Signature for an "HMAC <signature>" Authorization header
+    """
+    digest = hmac.new(base64.b64decode(secret_b64), body, hashlib.sha256).digest()
+    return base64.b64encode(digest).decode()
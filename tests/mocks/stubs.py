@@ -0,0 +1,48 @@
+"""
+Lightweight awaitable stubs for unit tests.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+def async_stub(return_value: Any = None, side_effect: Any = None) -> Callable[..., Awaitable[Any]]:
+    """
+    Build a coroutine function that records calls without AsyncMock's overhead.
+
+    side_effect follows AsyncMock: an exception (class or instance) is raised,
+    an iterable yields one result per call (exceptions in it are raised), and
+    a callable is called with the arguments and its result returned.
+
+    Args:
+        return_value: Value returned when there is no side_effect
+        side_effect: Exception, iterable or callable as described above
+
+    Returns:
+        Coroutine function with a ``calls`` list of (args, kwargs) tuples
+    """
+    calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+    if isinstance(side_effect, BaseException) or (
+        isinstance(side_effect, type) and issubclass(side_effect, BaseException)
+    ):
+        exc, results = side_effect, None
+    elif side_effect is None or callable(side_effect):
+        exc, results = None, None
+    else:
+        exc, results = None, iter(side_effect)
+
+    async def stub(*args: Any, **kwargs: Any) -> Any:
+        calls.append((args, kwargs))
+        if exc is not None:
+            raise exc
+        if results is not None:
+            result = next(results)
+            if isinstance(result, BaseException):
+                raise result
+            return result
+        if side_effect is not None:
+            return side_effect(*args, **kwargs)
+        return return_value
+
+    stub.calls = calls  # type: ignore[attr-defined]
+    return stub
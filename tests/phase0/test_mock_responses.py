@@ -2,12 +2,17 @@
 Tests for Mock Responses data.
 """
 
+import pytest
+
 from tests.mocks.mock_responses import (
     DEFAULT_RESPONSE,
     KNOWLEDGE_BASE,
+    get_response_for_lowercase,
     get_response_for_query,
 )
 
+_KB_ITEMS = list(KNOWLEDGE_BASE.items())
+
 
 class TestKnowledgeBase:
     """Tests for KNOWLEDGE_BASE data."""
@@ -16,27 +21,15 @@ class TestKnowledgeBase:
         """Knowledge base has at least 5 entries."""
         assert len(KNOWLEDGE_BASE) >= 5
 
-    def test_entries_have_required_fields(self) -> None:
-        """Each entry has text, sources, confidence."""
-        for keyword, data in KNOWLEDGE_BASE.items():
-            assert "text" in data, f"Missing 'text' in {keyword}"
-            assert "sources" in data, f"Missing 'sources' in {keyword}"
-            assert "confidence" in data, f"Missing 'confidence' in {keyword}"
-
-    def test_confidence_in_valid_range(self) -> None:
-        """Confidence scores are between 0 and 1."""
-        for keyword, data in KNOWLEDGE_BASE.items():
-            assert 0 <= data["confidence"] <= 1, f"Invalid confidence for {keyword}"
-
-    def test_text_is_not_empty(self) -> None:
-        """Text responses are not empty."""
-        for keyword, data in KNOWLEDGE_BASE.items():
-            assert len(data["text"]) > 0, f"Empty text for {keyword}"
-
-    def test_sources_is_list(self) -> None:
-        """Sources is a list."""
-        for keyword, data in KNOWLEDGE_BASE.items():
-            assert isinstance(data["sources"], list), f"Sources not a list for {keyword}"
+    @pytest.mark.parametrize(("keyword", "data"), _KB_ITEMS, ids=[k for k, _ in _KB_ITEMS])
+    def test_entry_shape(self, keyword: str, data: dict) -> None:
+        """Each entry has non-empty text, a sources list and a 0-1 confidence."""
+        assert "text" in data, f"Missing 'text' in {keyword}"
+        assert "sources" in data, f"Missing 'sources' in {keyword}"
+        assert "confidence" in data, f"Missing 'confidence' in {keyword}"
+        assert 0 <= data["confidence"] <= 1, f"Invalid confidence for {keyword}"
+        assert len(data["text"]) > 0, f"Empty text for {keyword}"
+        assert isinstance(data["sources"], list), f"Sources not a list for {keyword}"
 
 
 class TestDefaultResponse:
@@ -85,3 +78,7 @@ class TestGetResponseForQuery:
         """Always returns a dict."""
         response = get_response_for_query("anything")
         assert isinstance(response, dict)
+
+    def test_lowercase_variant_matches(self) -> None:
+        """Pre-lowercased lookup returns the same entry as the main function."""
+        assert get_response_for_lowercase("horario?") is get_response_for_query("HORARIO?")
@@ -2,8 +2,20 @@
 Tests for Mock Webhook Receiver.
 """
 
+import pytest
 from fastapi.testclient import TestClient
 
+# For posting the pre-serialized sample payloads from conftest
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Teams message addressed to the bot; tests fill in "text"
+_MSG_TEMPLATE = {
+    "type": "message",
+    "id": "test-001",
+    "from": {"id": "user-001", "name": "Test"},
+    "conversation": {"id": "conv-001"},
+}
+
 
 class TestMockWebhookHealth:
     """Tests for /health endpoint."""
@@ -24,91 +36,52 @@ class TestMockWebhookMessage:
     def test_simple_message(
         self,
         webhook_test_client: TestClient,
-        sample_teams_message: dict,
+        sample_teams_message: bytes,
     ) -> None:
         """Simple message is handled correctly."""
-        response = webhook_test_client.post("/webhook", json=sample_teams_message)
+        response = webhook_test_client.post(
+            "/webhook", content=sample_teams_message, headers=JSON_HEADERS
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["type"] == "message"
         assert "text" in data
 
-    def test_message_with_mention(
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("/clear", ["limpiado", "cleared"]),
+            ("/history", ["historial", "history"]),
+            ("/help", ["comando", "command"]),
+            ("Este es mi mensaje", ["este es mi mensaje"]),
+        ],
+        ids=["clear", "history", "help", "mention_stripped"],
+    )
+    def test_mentioned_message(
         self,
         webhook_test_client: TestClient,
+        text: str,
+        expected: list[str],
     ) -> None:
-        """Message with @mention has mention stripped."""
-        message = {
-            "type": "message",
-            "id": "test-001",
-            "text": "<at>Bot</at> Este es mi mensaje",
-            "from": {"id": "user-001", "name": "Test"},
-            "conversation": {"id": "conv-001"},
-        }
-
-        response = webhook_test_client.post("/webhook", json=message)
-
-        assert response.status_code == 200
-        data = response.json()
-        # The response should reference the message without the mention
-        assert "Este es mi mensaje" in data["text"]
-
-    def test_clear_command(self, webhook_test_client: TestClient) -> None:
-        """Command /clear is handled."""
-        message = {
-            "type": "message",
-            "id": "test-001",
-            "text": "<at>Bot</at> /clear",
-            "from": {"id": "user-001", "name": "Test"},
-            "conversation": {"id": "conv-001"},
-        }
-
-        response = webhook_test_client.post("/webhook", json=message)
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "limpiado" in data["text"].lower() or "cleared" in data["text"].lower()
-
-    def test_history_command(self, webhook_test_client: TestClient) -> None:
-        """Command /history is handled."""
-        message = {
-            "type": "message",
-            "id": "test-001",
-            "text": "<at>Bot</at> /history",
-            "from": {"id": "user-001", "name": "Test"},
-            "conversation": {"id": "conv-001"},
-        }
-
-        response = webhook_test_client.post("/webhook", json=message)
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "historial" in data["text"].lower() or "history" in data["text"].lower()
-
-    def test_help_command(self, webhook_test_client: TestClient) -> None:
-        """Command /help is handled."""
-        message = {
-            "type": "message",
-            "id": "test-001",
-            "text": "<at>Bot</at> /help",
-            "from": {"id": "user-001", "name": "Test"},
-            "conversation": {"id": "conv-001"},
-        }
+        """Commands are handled and plain messages echo without the mention."""
+        message = {**_MSG_TEMPLATE, "text": f"<at>Bot</at> {text}"}
 
         response = webhook_test_client.post("/webhook", json=message)
 
         assert response.status_code == 200
         data = response.json()
-        assert "comando" in data["text"].lower() or "command" in data["text"].lower()
+        assert any(s in data["text"].lower() for s in expected)
 
     def test_response_format(
         self,
         webhook_test_client: TestClient,
-        sample_teams_message: dict,
+        sample_teams_message: bytes,
     ) -> None:
         """Response has Teams message format."""
-        response = webhook_test_client.post("/webhook", json=sample_teams_message)
+        response = webhook_test_client.post(
+            "/webhook", content=sample_teams_message, headers=JSON_HEADERS
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -2,8 +2,13 @@
 Tests for Adaptive Card Builder.
 """
 
+import time
+from types import SimpleNamespace
+
+import orjson
 import pytest
 
+from src.teams.sender import cards
 from src.teams.sender.cards import AdaptiveCardBuilder
 
 
@@ -82,6 +87,21 @@ class TestAdaptiveCardBuilder:
         assert fact_set is not None
         assert len(fact_set["facts"]) == 3
 
+    def test_report_card_stringifies_non_str_facts(self, builder: AdaptiveCardBuilder) -> None:
+        """Test non-string report keys and values are rendered as strings."""
+        card = builder.build_report_card(
+            title="Report",
+            message="Numbers",
+            data={"Errors": 3, 2024: "year", "Ratio": 0.5},
+        )
+
+        fact_set = next(item for item in card["body"] if item.get("type") == "FactSet")
+        assert fact_set["facts"] == [
+            {"title": "Errors", "value": "3"},
+            {"title": "2024", "value": "year"},
+            {"title": "Ratio", "value": "0.5"},
+        ]
+
     def test_build_by_type(self, builder: AdaptiveCardBuilder) -> None:
         """Test build method with type selection."""
         card = builder.build(
@@ -93,6 +113,43 @@ class TestAdaptiveCardBuilder:
 
         assert card["type"] == "AdaptiveCard"
 
+    @pytest.mark.parametrize("card_type", ["alert", "info", "report"])
+    def test_build_dispatches_each_type(self, builder: AdaptiveCardBuilder, card_type: str) -> None:
+        """Test build() produces the same card as the type-specific builder."""
+        method = getattr(builder, f"build_{card_type}_card")
+        expected = method(title="T", message="M", priority="low")
+
+        assert builder.build(card_type, title="T", message="M", priority="low") == expected
+
+    def test_build_forwards_type_specific_options(self, builder: AdaptiveCardBuilder) -> None:
+        """Test build() passes each card type only the options it uses."""
+        card = builder.build(
+            "alert",
+            title="T",
+            message="M",
+            action_url="https://example.com",
+            data={"unused": "by alerts"},
+        )
+
+        assert card["actions"][0]["url"] == "https://example.com"
+        assert all(item.get("type") != "FactSet" for item in card["body"])
+
+    def test_build_rejects_unknown_options(self, builder: AdaptiveCardBuilder) -> None:
+        """Test misspelled options raise instead of being dropped."""
+        with pytest.raises(TypeError):
+            builder.build("info", title="T", message="M", details="typo for footer")
+
+    def test_build_bytes_matches_build(self, builder: AdaptiveCardBuilder) -> None:
+        """Test build_bytes returns the JSON encoding of build()."""
+        encoded = builder.build_bytes("report", "T", "M", data={"Errors": 3})
+
+        assert isinstance(encoded, bytes)
+        assert orjson.loads(encoded) == builder.build("report", "T", "M", data={"Errors": 3})
+
+    def test_builder_has_no_instance_dict(self, builder: AdaptiveCardBuilder) -> None:
+        """Test the stateless builder is slotted."""
+        assert not hasattr(builder, "__dict__")
+
     def test_build_unknown_type_raises(self, builder: AdaptiveCardBuilder) -> None:
         """Test that unknown card type raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
@@ -104,21 +161,13 @@ class TestAdaptiveCardBuilder:
 
         assert "Unknown card type" in str(exc_info.value)
 
-    def test_priority_colors(self, builder: AdaptiveCardBuilder) -> None:
+    def test_priority_colors(self) -> None:
         """Test that different priorities use different colors."""
-        priorities = ["low", "medium", "high", "critical"]
-        colors = set()
-
-        for priority in priorities:
-            card = builder.build_alert_card(
-                title="Test",
-                message="Test",
-                priority=priority,
-            )
-            color = card["body"][0]["style"]
-            colors.add(color)
+        styles = AdaptiveCardBuilder.PRIORITY_STYLES
+        colors = {styles[p][1] for p in ("low", "medium", "high", "critical")}
 
-        # Each priority should have a different color
+        # Each priority should have a different color; test_build_alert_card
+        # checks the color is applied to the built card
         assert len(colors) == 4
 
     def test_priority_icons(self, builder: AdaptiveCardBuilder) -> None:
@@ -137,3 +186,29 @@ class TestAdaptiveCardBuilder:
                 priority=priority,
             )
             assert expected_icon in card["body"][0]["text"]
+
+    def test_timestamp_formatted_once_per_second(
+        self, builder: AdaptiveCardBuilder, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that cards built within the same second reuse the timestamp."""
+        calls = []
+
+        def counting_strftime(fmt: str, t: time.struct_time) -> str:
+            calls.append(t)
+            return time.strftime(fmt, t)
+
+        fake_time = SimpleNamespace(
+            time=lambda: 1_700_000_000.5,
+            localtime=time.localtime,
+            strftime=counting_strftime,
+        )
+        monkeypatch.setattr(cards, "time", fake_time)
+        monkeypatch.setattr(cards, "_ts_cache", (-1, ""))
+
+        first = builder.build_alert_card(title="A", message="M")
+        second = builder.build_report_card(title="R", message="M")
+
+        expected = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(1_700_000_000))
+        assert first["body"][-1]["text"] == f"_{expected}_"
+        assert second["body"][-1]["text"] == f"Generado: {expected}"
+        assert len(calls) == 1
@@ -2,41 +2,74 @@
 Tests for Notifier API.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import dataclasses
+from collections.abc import Iterator
+from typing import Any, Optional
 
 import pytest
 from fastapi.testclient import TestClient
 
-from src.api.notifier_api import app
+from src.api.notifier_api import app, get_channels, get_service
 from src.notifier.channels import Channel, ChannelRegistry
 from src.notifier.models import Notification
 
+# Delivered notification shared by tests; tests derive variants with
+# dataclasses.replace instead of mutating it
+_SENT_NOTIFICATION = Notification(channel="alerts", message="Test message")
+_SENT_NOTIFICATION.mark_sent()
+
+
+class _FakeService:
+    """Stand-in NotificationService that records notify() calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self.result: Optional[Notification] = None
+        self.exc: Optional[Exception] = None
+
+    async def notify(self, **kwargs: Any) -> Optional[Notification]:
+        """Record the call, then raise exc or return result."""
+        self.calls.append(kwargs)
+        if self.exc is not None:
+            raise self.exc
+        return self.result
+
+
+# Read-only channel registry served to every test in this module
+_TEST_REGISTRY = ChannelRegistry()
+_TEST_REGISTRY.register(
+    Channel(
+        name="alerts",
+        webhook_url="https://test.webhook.com/alerts",
+        description="Alert channel",
+    )
+)
+
+
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    """Create a module-wide test client that serves _TEST_REGISTRY as its channels."""
+    app.dependency_overrides[get_channels] = lambda: _TEST_REGISTRY
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
 
 class TestNotifierAPI:
     """Tests for the Notifier API."""
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create a test client."""
-        return TestClient(app)
-
     @pytest.fixture
     def api_key(self) -> str:
         """Test API key matching settings default."""
         return "dev-api-key"
 
     @pytest.fixture
-    def mock_channels(self) -> ChannelRegistry:
-        """Create mock channels."""
-        registry = ChannelRegistry()
-        registry.register(
-            Channel(
-                name="alerts",
-                webhook_url="https://test.webhook.com/alerts",
-                description="Alert channel",
-            )
-        )
-        return registry
+    def mock_service(self) -> Iterator[_FakeService]:
+        """Inject a fake notification service into the app."""
+        service = _FakeService()
+        app.dependency_overrides[get_service] = lambda: service
+        yield service
+        del app.dependency_overrides[get_service]
 
     def test_health_no_auth(self, client: TestClient) -> None:
         """Test health endpoint doesn't require auth."""
@@ -70,28 +103,20 @@ class TestNotifierAPI:
         self,
         client: TestClient,
         api_key: str,
-        mock_channels: ChannelRegistry,
+        mock_service: _FakeService,
     ) -> None:
         """Test successful notification."""
-        mock_notification = Notification(
-            channel="alerts",
-            message="Test message",
+        mock_service.result = _SENT_NOTIFICATION
+
+        response = client.post(
+            "/api/v1/notify",
+            json={
+                "channel": "alerts",
+                "message": "Test message",
+                "priority": "high",
+            },
+            headers={"X-API-Key": api_key},
         )
-        mock_notification.mark_sent()
-
-        mock_service = MagicMock()
-        mock_service.notify = AsyncMock(return_value=mock_notification)
-
-        with patch("src.api.notifier_api.get_service", return_value=mock_service):
-            response = client.post(
-                "/api/v1/notify",
-                json={
-                    "channel": "alerts",
-                    "message": "Test message",
-                    "priority": "high",
-                },
-                headers={"X-API-Key": api_key},
-            )
 
         assert response.status_code == 200
         data = response.json()
@@ -103,20 +128,19 @@ class TestNotifierAPI:
         self,
         client: TestClient,
         api_key: str,
+        mock_service: _FakeService,
     ) -> None:
         """Test notification to unknown channel."""
-        mock_service = MagicMock()
-        mock_service.notify = AsyncMock(side_effect=ValueError("Channel 'unknown' not found"))
-
-        with patch("src.api.notifier_api.get_service", return_value=mock_service):
-            response = client.post(
-                "/api/v1/notify",
-                json={
-                    "channel": "unknown",
-                    "message": "Test",
-                },
-                headers={"X-API-Key": api_key},
-            )
+        mock_service.exc = ValueError("Channel 'unknown' not found")
+
+        response = client.post(
+            "/api/v1/notify",
+            json={
+                "channel": "unknown",
+                "message": "Test",
+            },
+            headers={"X-API-Key": api_key},
+        )
 
         assert response.status_code == 404
 
@@ -124,14 +148,12 @@ class TestNotifierAPI:
         self,
         client: TestClient,
         api_key: str,
-        mock_channels: ChannelRegistry,
     ) -> None:
         """Test listing channels."""
-        with patch("src.api.notifier_api.get_channels", return_value=mock_channels):
-            response = client.get(
-                "/api/v1/channels",
-                headers={"X-API-Key": api_key},
-            )
+        response = client.get(
+            "/api/v1/channels",
+            headers={"X-API-Key": api_key},
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -159,33 +181,25 @@ class TestNotifierAPI:
         self,
         client: TestClient,
         api_key: str,
+        mock_service: _FakeService,
     ) -> None:
         """Test notification with card type."""
-        mock_notification = Notification(
-            channel="alerts",
-            message="Test",
-            card_type="alert",
+        mock_service.result = dataclasses.replace(_SENT_NOTIFICATION, card_type="alert")
+
+        response = client.post(
+            "/api/v1/notify",
+            json={
+                "channel": "alerts",
+                "message": "Alert message",
+                "title": "System Alert",
+                "card_type": "alert",
+                "priority": "critical",
+            },
+            headers={"X-API-Key": api_key},
         )
-        mock_notification.mark_sent()
-
-        mock_service = MagicMock()
-        mock_service.notify = AsyncMock(return_value=mock_notification)
-
-        with patch("src.api.notifier_api.get_service", return_value=mock_service):
-            response = client.post(
-                "/api/v1/notify",
-                json={
-                    "channel": "alerts",
-                    "message": "Alert message",
-                    "title": "System Alert",
-                    "card_type": "alert",
-                    "priority": "critical",
-                },
-                headers={"X-API-Key": api_key},
-            )
 
         assert response.status_code == 200
-        mock_service.notify.assert_called_once()
-        call_kwargs = mock_service.notify.call_args[1]
+        assert len(mock_service.calls) == 1
+        call_kwargs = mock_service.calls[0]
         assert call_kwargs["card_type"] == "alert"
         assert call_kwargs["priority"] == "critical"
@@ -2,7 +2,7 @@
 Tests for Notification Service.
 """
 
-from unittest.mock import AsyncMock
+from typing import Any, Optional
 
 import pytest
 
@@ -12,16 +12,41 @@ from src.notifier.models import Notification, NotificationStatus, Priority
 from src.notifier.service import NotificationService
 
 
+class _FakeSender:
+    """In-memory sender that counts sends and can be set to fail."""
+
+    def __init__(self) -> None:
+        self.text_calls = 0
+        self.card_calls = 0
+        self.last_card: Any = None
+        self.error: Optional[Exception] = None
+
+    async def send_text(self, *args: Any, **kwargs: Any) -> bool:
+        """Count a text send, raising error if set."""
+        self.text_calls += 1
+        if self.error is not None:
+            raise self.error
+        return True
+
+    async def send_card(self, *args: Any, **kwargs: Any) -> bool:
+        """Count a card send and keep the card, raising error if set."""
+        self.card_calls += 1
+        self.last_card = args[1]
+        if self.error is not None:
+            raise self.error
+        return True
+
+
 class TestNotificationModels:
     """Tests for notification models."""
 
-    def test_notification_creation(self) -> None:
-        """Test creating a notification."""
+    def test_notification_lifecycle(self) -> None:
+        """Test creating, serializing and marking notifications sent or failed."""
         notification = Notification(
             channel="alerts",
             message="Test message",
             title="Test Title",
-            priority=Priority.HIGH,
+            priority=Priority.CRITICAL,
         )
 
         assert notification.channel == "alerts"
@@ -29,35 +54,22 @@ class TestNotificationModels:
         assert notification.status == NotificationStatus.PENDING
         assert notification.id is not None
 
-    def test_notification_mark_sent(self) -> None:
-        """Test marking notification as sent."""
-        notification = Notification(channel="alerts", message="Test")
-        notification.mark_sent()
-
-        assert notification.status == NotificationStatus.SENT
-        assert notification.sent_at is not None
-
-    def test_notification_mark_failed(self) -> None:
-        """Test marking notification as failed."""
-        notification = Notification(channel="alerts", message="Test")
-        notification.mark_failed("Connection error")
-
-        assert notification.status == NotificationStatus.FAILED
-        assert notification.error == "Connection error"
-
-    def test_notification_to_dict(self) -> None:
-        """Test converting notification to dict."""
-        notification = Notification(
-            channel="alerts",
-            message="Test",
-            priority=Priority.CRITICAL,
-        )
         data = notification.to_dict()
-
         assert data["channel"] == "alerts"
         assert data["priority"] == "critical"
         assert data["status"] == "pending"
 
+        notification.mark_sent()
+        assert notification.status == NotificationStatus.SENT
+        assert notification.sent_at is not None
+        assert notification.to_dict()["status"] == "sent"
+
+        # Sent is terminal, so failure needs its own notification
+        failed = Notification(channel="alerts", message="Test")
+        failed.mark_failed("Connection error")
+        assert failed.status == NotificationStatus.FAILED
+        assert failed.error == "Connection error"
+
 
 class TestChannelRegistry:
     """Tests for ChannelRegistry."""
@@ -122,14 +134,11 @@ class TestNotificationService:
     """Tests for NotificationService."""
 
     @pytest.fixture
-    def mock_sender(self) -> AsyncMock:
-        """Create a mock sender."""
-        sender = AsyncMock()
-        sender.send_text.return_value = True
-        sender.send_card.return_value = True
-        return sender
+    def mock_sender(self) -> _FakeSender:
+        """Create a fake sender."""
+        return _FakeSender()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def registry(self) -> ChannelRegistry:
         """Create a channel registry with test channels."""
         registry = ChannelRegistry()
@@ -148,12 +157,13 @@ class TestNotificationService:
         return registry
 
     @pytest.fixture
-    def service(self, mock_sender: AsyncMock, registry: ChannelRegistry) -> NotificationService:
+    def service(self, mock_sender: _FakeSender, registry: ChannelRegistry) -> NotificationService:
         """Create a notification service."""
         return NotificationService(mock_sender, registry)
 
-    @pytest.mark.asyncio
-    async def test_notify_text(self, service: NotificationService, mock_sender: AsyncMock) -> None:
+    async def test_notify_text(
+        self, service: NotificationService, mock_sender: _FakeSender
+    ) -> None:
         """Test sending a text notification."""
         notification = await service.notify(
             channel="alerts",
@@ -162,10 +172,11 @@ class TestNotificationService:
         )
 
         assert notification.status == NotificationStatus.SENT
-        mock_sender.send_text.assert_called_once()
+        assert mock_sender.text_calls == 1
 
-    @pytest.mark.asyncio
-    async def test_notify_card(self, service: NotificationService, mock_sender: AsyncMock) -> None:
+    async def test_notify_card(
+        self, service: NotificationService, mock_sender: _FakeSender
+    ) -> None:
         """Test sending a card notification."""
         notification = await service.notify(
             channel="alerts",
@@ -176,9 +187,23 @@ class TestNotificationService:
         )
 
         assert notification.status == NotificationStatus.SENT
-        mock_sender.send_card.assert_called_once()
+        assert mock_sender.card_calls == 1
+
+    async def test_notify_card_passes_only_card_options(
+        self, service: NotificationService, mock_sender: _FakeSender
+    ) -> None:
+        """Test card options are taken from metadata and other keys are kept out."""
+        notification = await service.notify(
+            channel="alerts",
+            message="Test message",
+            card_type="alert",
+            metadata={"action_url": "https://example.com", "ticket_id": "ABC-1"},
+        )
+
+        assert notification.status == NotificationStatus.SENT
+        assert notification.metadata["ticket_id"] == "ABC-1"
+        assert mock_sender.last_card["actions"][0]["url"] == "https://example.com"
 
-    @pytest.mark.asyncio
     async def test_notify_unknown_channel(self, service: NotificationService) -> None:
         """Test error when channel not found."""
         with pytest.raises(ValueError) as exc_info:
@@ -189,14 +214,13 @@ class TestNotificationService:
 
         assert "not found" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_notify_sender_failure(
         self,
         service: NotificationService,
-        mock_sender: AsyncMock,
+        mock_sender: _FakeSender,
     ) -> None:
         """Test handling sender failure."""
-        mock_sender.send_text.side_effect = TeamsError("Send failed")
+        mock_sender.error = TeamsError("Send failed")
 
         with pytest.raises(TeamsError):
             await service.notify(
@@ -204,8 +228,7 @@ class TestNotificationService:
                 message="Test",
             )
 
-    @pytest.mark.asyncio
-    async def test_notify_all(self, service: NotificationService, mock_sender: AsyncMock) -> None:
+    async def test_notify_all(self, service: NotificationService, mock_sender: _FakeSender) -> None:
         """Test sending to all channels."""
         notifications = await service.notify_all(
             message="Broadcast message",
@@ -213,4 +236,22 @@ class TestNotificationService:
         )
 
         assert len(notifications) == 2
-        assert mock_sender.send_text.call_count == 2
+        assert mock_sender.text_calls == 2
+
+    @pytest.mark.parametrize("n_channels", [1, 100])
+    async def test_notify_all_scales_with_channels(
+        self,
+        mock_sender: _FakeSender,
+        n_channels: int,
+    ) -> None:
+        """Test broadcast sends exactly once per registered channel."""
+        registry = ChannelRegistry()
+        for i in range(n_channels):
+            registry.register(Channel(name=f"ch{i}", webhook_url=f"https://a.com/{i}"))
+        service = NotificationService(mock_sender, registry)
+
+        notifications = await service.notify_all(message="Broadcast message")
+
+        assert len(notifications) == n_channels
+        assert mock_sender.text_calls == n_channels
+        assert all(n.status == NotificationStatus.SENT for n in notifications)
@@ -2,12 +2,23 @@
 Tests for WebhookSender.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Awaitable, Callable
+from unittest.mock import AsyncMock, patch
 
+import httpx
+import orjson
 import pytest
 
 from src.core.exceptions import TeamsError
-from src.teams.sender.webhook_sender import WebhookSender
+from src.teams.sender.webhook_sender import (
+    MAX_PAYLOAD_BYTES,
+    MAX_TRACKED_WEBHOOKS,
+    POOL_LIMITS,
+    WebhookSender,
+    _bucket_key,
+)
+from tests.mocks.http import make_response
+from tests.mocks.stubs import async_stub
 
 
 class TestWebhookSender:
@@ -18,6 +29,13 @@ class TestWebhookSender:
         """Create a WebhookSender instance."""
         return WebhookSender(timeout=5.0, max_retries=2, retry_delay=0.1)
 
+    @pytest.fixture
+    def no_retry_sleep(self, monkeypatch: pytest.MonkeyPatch) -> Callable[..., Awaitable[None]]:
+        """Make the sender's backoff sleeps return immediately for this test."""
+        sleep = async_stub()
+        monkeypatch.setattr("src.teams.sender.webhook_sender.asyncio.sleep", sleep)
+        return sleep
+
     @pytest.fixture
     def webhook_url(self) -> str:
         """Sample webhook URL."""
@@ -26,27 +44,25 @@ class TestWebhookSender:
     @pytest.mark.asyncio
     async def test_send_text_success(self, sender: WebhookSender, webhook_url: str) -> None:
         """Test successful text message send."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+        mock_response = make_response(200)
 
         with patch.object(sender, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
+            mock_client.post = async_stub(mock_response)
             mock_get_client.return_value = mock_client
 
             result = await sender.send_text(webhook_url, "Hello Teams!")
 
             assert result is True
-            mock_client.post.assert_called_once()
-            call_args = mock_client.post.call_args
+            assert len(mock_client.post.calls) == 1
+            call_args = mock_client.post.calls[-1]
             assert call_args[0][0] == webhook_url
-            assert call_args[1]["json"] == {"text": "Hello Teams!"}
+            assert call_args[1]["content"] == b'{"text":"Hello Teams!"}'
 
     @pytest.mark.asyncio
     async def test_send_card_success(self, sender: WebhookSender, webhook_url: str) -> None:
         """Test successful Adaptive Card send."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+        mock_response = make_response(200)
 
         card = {
             "type": "AdaptiveCard",
@@ -56,14 +72,14 @@ class TestWebhookSender:
 
         with patch.object(sender, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
+            mock_client.post = async_stub(mock_response)
             mock_get_client.return_value = mock_client
 
             result = await sender.send_card(webhook_url, card)
 
             assert result is True
-            call_args = mock_client.post.call_args
-            payload = call_args[1]["json"]
+            call_args = mock_client.post.calls[-1]
+            payload = orjson.loads(call_args[1]["content"])
             assert payload["type"] == "message"
             assert (
                 payload["attachments"][0]["contentType"]
@@ -71,64 +87,444 @@ class TestWebhookSender:
             )
             assert payload["attachments"][0]["content"] == card
 
+    def test_encoded_envelope_matches_full_encoding(self) -> None:
+        """Test the pre-built envelope bytes equal encoding the whole message."""
+        card = {"type": "AdaptiveCard", "body": [{"type": "TextBlock", "text": "Hi"}]}
+        message = {
+            "type": "message",
+            "attachments": [
+                {"contentType": "application/vnd.microsoft.card.adaptive", "content": card}
+            ],
+        }
+
+        assert WebhookSender._encode_card(card) == orjson.dumps(message)
+
     @pytest.mark.asyncio
-    async def test_send_retry_on_server_error(
+    async def test_send_card_accepts_encoded_card(
         self, sender: WebhookSender, webhook_url: str
+    ) -> None:
+        """Test a pre-encoded card is posted in the same envelope as a dict."""
+        mock_response = make_response(200)
+        card = {"type": "AdaptiveCard", "body": [{"type": "TextBlock", "text": "ñ ✓"}]}
+
+        with patch.object(sender, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post = async_stub(mock_response)
+            mock_get_client.return_value = mock_client
+
+            await sender.send_card(webhook_url, card)
+            await sender.send_card(webhook_url, orjson.dumps(card))
+
+        from_dict, from_bytes = (c[1]["content"] for c in mock_client.post.calls)
+        assert from_bytes == from_dict
+
+    @pytest.mark.asyncio
+    async def test_url_logger_bound_once(self, sender: WebhookSender, webhook_url: str) -> None:
+        """Test the per-URL bound logger is created once and reused."""
+        mock_response = make_response(200)
+
+        with patch.object(sender, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post = async_stub(mock_response)
+            mock_get_client.return_value = mock_client
+
+            await sender.send_text(webhook_url, "one")
+            bound = sender._log_by_url[webhook_url]
+            await sender.send_text(webhook_url, "two")
+
+        assert sender._log_by_url == {webhook_url: bound}
+
+    @pytest.mark.asyncio
+    async def test_url_loggers_are_capped(self, sender: WebhookSender, webhook_url: str) -> None:
+        """Test the per-URL logger cache evicts its oldest entry when full."""
+        mock_response = make_response(200)
+        urls = [f"{webhook_url}-{i}" for i in range(MAX_TRACKED_WEBHOOKS + 1)]
+
+        with patch.object(sender, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post = async_stub(mock_response)
+            mock_get_client.return_value = mock_client
+
+            for url in urls:
+                await sender.send_text(url, "hi")
+
+        assert list(sender._log_by_url) == urls[1:]
+
+    @pytest.mark.asyncio
+    async def test_send_retry_on_server_error(
+        self,
+        sender: WebhookSender,
+        webhook_url: str,
+        no_retry_sleep: Callable[..., Awaitable[None]],
     ) -> None:
         """Test retry on 5xx errors."""
-        mock_response_fail = MagicMock()
-        mock_response_fail.status_code = 500
-        mock_response_fail.text = "Internal Server Error"
+        mock_response_fail = make_response(500, content=b"Internal Server Error")
 
-        mock_response_success = MagicMock()
-        mock_response_success.status_code = 200
+        mock_response_success = make_response(200)
 
         with patch.object(sender, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
-            mock_client.post.side_effect = [mock_response_fail, mock_response_success]
+            mock_client.post = async_stub(side_effect=[mock_response_fail, mock_response_success])
             mock_get_client.return_value = mock_client
 
             result = await sender.send_text(webhook_url, "Test")
 
             assert result is True
-            assert mock_client.post.call_count == 2
+            assert len(mock_client.post.calls) == 2
+            # Payload is encoded once and reused across attempts
+            first, second = mock_client.post.calls
+            assert first[1]["content"] is second[1]["content"]
 
     @pytest.mark.asyncio
-    async def test_send_fails_after_retries(self, sender: WebhookSender, webhook_url: str) -> None:
+    async def test_send_fails_after_retries(
+        self,
+        sender: WebhookSender,
+        webhook_url: str,
+        no_retry_sleep: Callable[..., Awaitable[None]],
+    ) -> None:
         """Test failure after exhausting retries."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Server Error"
+        mock_response = make_response(500, content=b"Server Error")
 
         with patch.object(sender, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
+            mock_client.post = async_stub(mock_response)
             mock_get_client.return_value = mock_client
 
             with pytest.raises(TeamsError) as exc_info:
                 await sender.send_text(webhook_url, "Test")
 
             assert "Failed to send after 2 attempts" in str(exc_info.value)
+            assert len(no_retry_sleep.calls) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("jitter", "schedule"),
+        [
+            # Lower edge: never below retry_delay
+            (0.0, [1.0, 1.0, 1.0, 1.0]),
+            # Midpoint: retry_delay + 0.5 * (min(cap, previous * 3) - retry_delay)
+            (0.5, [2.0, 3.5, 5.75, 9.125]),
+            # Upper edge: min(MAX_RETRY_DELAY, previous * 3)
+            (1.0, [3.0, 9.0, 27.0, 30.0]),
+        ],
+        ids=["lower", "mid", "upper"],
+    )
+    async def test_retry_backoff_is_jittered_and_capped(
+        self, webhook_url: str, jitter: float, schedule: list[float]
+    ) -> None:
+        """Test the backoff schedule stays within the decorrelated jitter window."""
+        sender = WebhookSender(timeout=100.0, max_retries=5, retry_delay=1.0, rate_limit=None)
+        mock_response = make_response(500, content=b"Server Error")
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+
+        with (
+            patch.object(sender, "_get_client") as mock_get_client,
+            patch("src.teams.sender.webhook_sender.asyncio.sleep", fake_sleep),
+            patch("src.teams.sender.webhook_sender.random.random", return_value=jitter),
+        ):
+            mock_client = AsyncMock()
+            mock_client.post = async_stub(mock_response)
+            mock_get_client.return_value = mock_client
+
+            with pytest.raises(TeamsError):
+                await sender.send_text(webhook_url, "Test")
+
+        assert sleeps == pytest.approx(schedule)
+
+    @pytest.mark.asyncio
+    async def test_retry_stops_at_deadline(self, webhook_url: str) -> None:
+        """Test no retry is attempted when the backoff would pass the deadline."""
+        sender = WebhookSender(timeout=1.0, max_retries=3, retry_delay=2.0, rate_limit=None)
+        mock_response = make_response(500, content=b"Server Error")
+
+        with (
+            patch.object(sender, "_get_client") as mock_get_client,
+            patch("src.teams.sender.webhook_sender.asyncio.sleep") as mock_sleep,
+            patch("src.teams.sender.webhook_sender.random.random", return_value=1.0),
+        ):
+            mock_client = AsyncMock()
+            mock_client.post = async_stub(mock_response)
+            mock_get_client.return_value = mock_client
+
+            with pytest.raises(TeamsError) as exc_info:
+                await sender.send_text(webhook_url, "Test")
+
+        assert len(mock_client.post.calls) == 1
+        mock_sleep.assert_not_called()
+        assert str(exc_info.value) == (
+            "Failed to send after 1 attempt, stopped by the retry deadline: HTTP 500: Server Error"
+        )
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_respects_deadline(self, webhook_url: str) -> None:
+        """Test a Retry-After longer than the remaining deadline is not slept."""
+        sender = WebhookSender(timeout=1.0, max_retries=3, rate_limit=None)
+        mock_response = make_response(429, headers={"Retry-After": "60"})
+
+        with (
+            patch.object(sender, "_get_client") as mock_get_client,
+            patch("src.teams.sender.webhook_sender.asyncio.sleep") as mock_sleep,
+        ):
+            mock_client = AsyncMock()
+            mock_client.post = async_stub(mock_response)
+            mock_get_client.return_value = mock_client
+
+            with pytest.raises(TeamsError) as exc_info:
+                await sender.send_text(webhook_url, "Test")
+
+        assert len(mock_client.post.calls) == 1
+        mock_sleep.assert_not_called()
+        assert "after 1 attempt, stopped by the retry deadline" in str(exc_info.value)
+        assert "HTTP 429" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("error", "label"),
+        [
+            (httpx.ReadTimeout("read timed out"), "Timeout: read timed out"),
+            (httpx.ConnectError("refused"), "Connection error: refused"),
+            (RuntimeError("boom"), "Unexpected error: boom"),
+        ],
+    )
+    async def test_transport_errors_are_labelled(
+        self, sender: WebhookSender, webhook_url: str, error: Exception, label: str
+    ) -> None:
+        """Test transport failures, including subclasses, are retried and labelled."""
+        with (
+            patch.object(sender, "_get_client") as mock_get_client,
+            patch("src.teams.sender.webhook_sender.asyncio.sleep"),
+        ):
+            mock_client = AsyncMock()
+            mock_client.post = async_stub(side_effect=error)
+            mock_get_client.return_value = mock_client
+
+            with pytest.raises(TeamsError) as exc_info:
+                await sender.send_text(webhook_url, "Test")
+
+        assert len(mock_client.post.calls) == 2
+        assert str(exc_info.value).endswith(label)
+
+    @pytest.mark.asyncio
+    async def test_oversized_payload_rejected_before_sending(
+        self, sender: WebhookSender, webhook_url: str
+    ) -> None:
+        """Test payloads over the Teams size limit never reach the network."""
+        with patch.object(sender, "_get_client") as mock_get_client:
+            with pytest.raises(TeamsError, match="Payload too large"):
+                await sender.send_text(webhook_url, "x" * MAX_PAYLOAD_BYTES)
+
+        mock_get_client.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_send_no_retry_on_client_error(
         self, sender: WebhookSender, webhook_url: str
     ) -> None:
         """Test no retry on 4xx errors."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
+        mock_response = make_response(400, content=b"Bad Request")
 
         with patch.object(sender, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
+            mock_client.post = async_stub(mock_response)
             mock_get_client.return_value = mock_client
 
             with pytest.raises(TeamsError):
                 await sender.send_text(webhook_url, "Test")
 
             # Should only try once for client errors
-            assert mock_client.post.call_count == 1
+            assert len(mock_client.post.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_error_body_is_truncated(self, sender: WebhookSender, webhook_url: str) -> None:
+        """Test only a bounded, lossily decoded prefix of an error body is kept."""
+        mock_response = make_response(413, content=b"\xff" + b"x" * 1000)
+
+        with patch.object(sender, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post = async_stub(mock_response)
+            mock_get_client.return_value = mock_client
+
+            with pytest.raises(TeamsError) as exc_info:
+                await sender.send_text(webhook_url, "Test")
+
+        assert str(exc_info.value).endswith("HTTP 413: \ufffd" + "x" * 199)
+
+    @pytest.mark.asyncio
+    async def test_send_cards_fan_out(self, sender: WebhookSender) -> None:
+        """Test sending one card to several webhooks collects per-URL results."""
+        ok = make_response(200)
+        bad = make_response(400, content=b"Bad Request")
+        responses = {"https://a": ok, "https://b": bad, "https://c": ok}
+
+        with patch.object(sender, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.post = async_stub(side_effect=lambda url, content: responses[url])
+            mock_get_client.return_value = mock_client
+
+            results = await sender.send_cards(list(responses), {"type": "AdaptiveCard"})
+
+            assert results[0] is True
+            assert isinstance(results[1], TeamsError)
+            assert results[2] is True
+            contents = {c[1]["content"] for c in mock_client.post.calls}
+            assert len(contents) == 1
+
+    @pytest.mark.asyncio
+    async def test_client_uses_http2_and_pool_limits(self, sender: WebhookSender) -> None:
+        """Test the lazily created client is HTTP/2 with tuned pool limits."""
+        with patch("src.teams.sender.webhook_sender.httpx.AsyncClient") as mock_client_cls:
+            await sender._get_client()
+
+            kwargs = mock_client_cls.call_args.kwargs
+            assert kwargs["http2"] is True
+            assert kwargs["limits"] is POOL_LIMITS
+            assert kwargs["timeout"].connect == 5.0
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_with_keepalive_pool(self, sender: WebhookSender) -> None:
+        """Test sends share one client whose pool keeps connections alive."""
+        try:
+            client = await sender._get_client()
+            assert await sender._get_client() is client
+
+            pool = client._transport._pool
+            assert pool._keepalive_expiry >= 15.0
+            assert pool._max_keepalive_connections >= 5
+        finally:
+            await sender.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_client_reused_across_senders(self) -> None:
+        """Test senders opting into sharing reuse one client per loop."""
+        first = WebhookSender(timeout=5.0, shared_client=True)
+        second = WebhookSender(timeout=5.0, shared_client=True)
+        try:
+            client = await first._get_client()
+            assert await second._get_client() is client
+
+            await first.close()
+            assert client.is_closed is False
+        finally:
+            await WebhookSender.shutdown()
+
+        assert client.is_closed is True
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_requests_after_burst(self) -> None:
+        """Test the token bucket delays requests beyond the burst size."""
+        sender = WebhookSender(rate_limit=10.0, rate_burst=2)
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+
+        with (
+            patch("src.teams.sender.webhook_sender.asyncio.sleep", fake_sleep),
+            patch("src.teams.sender.webhook_sender.time.monotonic", return_value=100.0),
+        ):
+            for _ in range(3):
+                await sender._acquire("https://example.com/hook?sig=1")
+            # Query string is ignored when keying buckets
+            await sender._acquire("https://example.com/hook?sig=2")
+
+        assert sleeps == pytest.approx([0.1, 0.2])
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            (
+                "https://Contoso.webhook.office.com/webhookb2/g@t/IncomingWebhook/c1/o1/V2sig",
+                "contoso.webhook.office.com/webhookb2/g@t/IncomingWebhook/c1",
+            ),
+            (
+                "https://prod.logic.azure.com/workflows/w1/triggers/manual/paths/invoke?sig=x",
+                "prod.logic.azure.com/workflows/w1/triggers/manual",
+            ),
+            ("https://example.com/hook/?sig=1#frag", "example.com/hook"),
+        ],
+        ids=["incoming_webhook", "workflow", "short_path"],
+    )
+    def test_bucket_key(self, url: str, expected: str) -> None:
+        """Test buckets are keyed by host and connector path prefix."""
+        assert _bucket_key(url) == expected
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_buckets_are_capped(self) -> None:
+        """Test the bucket table evicts its oldest webhook when full."""
+        sender = WebhookSender()
+        urls = [f"https://example.com/hook-{i}" for i in range(MAX_TRACKED_WEBHOOKS + 1)]
+
+        for url in urls:
+            await sender._acquire(url)
+
+        assert list(sender._buckets) == [_bucket_key(url) for url in urls[1:]]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_default_throttles(self) -> None:
+        """Test a default sender allows 4 back-to-back sends, then 1 per second."""
+        sender = WebhookSender()
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+
+        with (
+            patch("src.teams.sender.webhook_sender.asyncio.sleep", fake_sleep),
+            patch("src.teams.sender.webhook_sender.time.monotonic", return_value=100.0),
+        ):
+            for _ in range(6):
+                await sender._acquire("https://example.com/hook")
+
+        assert (sender.rate_limit, sender.rate_burst) == (1.0, 4)
+        assert sleeps == pytest.approx([1.0, 2.0])
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"rate_limit": 0}, {"rate_limit": -1.0}, {"rate_burst": 0}],
+        ids=["zero_rate", "negative_rate", "zero_burst"],
+    )
+    def test_rate_limit_settings_validated(self, kwargs: dict) -> None:
+        """Test invalid throttle settings are rejected at construction."""
+        with pytest.raises(ValueError):
+            WebhookSender(**kwargs)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_past_deadline_fails_fast(self, webhook_url: str) -> None:
+        """Test a throttle wait beyond the retry deadline fails without posting."""
+        sender = WebhookSender(timeout=1.0, max_retries=1, rate_limit=0.1, rate_burst=1)
+        sleep = async_stub()
+
+        with (
+            patch("src.teams.sender.webhook_sender.asyncio.sleep", sleep),
+            patch.object(sender, "_get_client") as mock_get_client,
+        ):
+            mock_client = AsyncMock()
+            mock_client.post = async_stub(make_response(200))
+            mock_get_client.return_value = mock_client
+
+            await sender.send_text(webhook_url, "first")
+            with pytest.raises(TeamsError) as exc_info:
+                await sender.send_text(webhook_url, "second")
+
+        assert len(mock_client.post.calls) == 1
+        assert sleep.calls == []
+        assert str(exc_info.value) == (
+            "Failed to send after 0 attempts, stopped by the retry deadline: "
+            "client-side rate limit wait exceeds the deadline"
+        )
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_disabled(self) -> None:
+        """Test that rate_limit=None never throttles."""
+        sender = WebhookSender(rate_limit=None)
+
+        with patch("src.teams.sender.webhook_sender.asyncio.sleep") as mock_sleep:
+            for _ in range(10):
+                await sender._acquire("https://example.com/hook")
+
+        mock_sleep.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_close(self, sender: WebhookSender) -> None:
@@ -1,25 +1,73 @@
 """Tests for AgentClient."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+from unittest.mock import patch
 
 import httpx
+import orjson
 import pytest
 
 from src.agent.client import (
+    POOL_LIMITS,
     AgentAPIError,
     AgentClient,
     AgentConnectionError,
     AgentTimeoutError,
 )
 from src.agent.models import ChatResponse
+from tests.mocks.http import Route, make_transport
+
+# Response bodies are encoded once; bytes are immutable, so tests share them
+_CHAT_RESPONSE_BODY = orjson.dumps(
+    {
+        "session_id": "sess-123",
+        "message": "Here are the suppliers for heat treatment.",
+        "agents_executed": [
+            {
+                "agent_name": "intent_classifier",
+                "display_name": "Intent Classifier",
+                "status": "completed",
+                "duration_ms": 50,
+                "output": {"intent": "supplier_search"},
+            }
+        ],
+        "intent": "supplier_search",
+        "confidence": 0.95,
+        "requires_approval": False,
+    }
+)
+_SESSION_BODY = orjson.dumps(
+    {
+        "session_id": "sess-123",
+        "status": "active",
+        "created_at": "2024-01-15T10:00:00Z",
+        "last_activity": "2024-01-15T10:30:00Z",
+        "message_count": 5,
+        "messages": [],
+    }
+)
+
+
+def _reply(status_code: int = 200, body: bytes = b"") -> Route:
+    """Route that answers every request with a fixed status and body."""
+    return lambda request: httpx.Response(status_code, content=body)
+
+
+def _fail(exc: Exception) -> Route:
+    """Route that raises exc as if the transport failed."""
+
+    def route(request: httpx.Request) -> httpx.Response:
+        raise exc
+
+    return route
 
 
 class TestAgentClient:
     """Tests for AgentClient class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self):
-        """Create an agent client."""
+        """Create an agent client shared by the class."""
         return AgentClient(
             base_url="http://localhost:8000",
             api_key="test-key",
@@ -27,26 +75,6 @@ class TestAgentClient:
             max_retries=2,
         )
 
-    @pytest.fixture
-    def chat_response_data(self):
-        """Sample chat response data."""
-        return {
-            "session_id": "sess-123",
-            "message": "Here are the suppliers for heat treatment.",
-            "agents_executed": [
-                {
-                    "agent_name": "intent_classifier",
-                    "display_name": "Intent Classifier",
-                    "status": "completed",
-                    "duration_ms": 50,
-                    "output": {"intent": "supplier_search"},
-                }
-            ],
-            "intent": "supplier_search",
-            "confidence": 0.95,
-            "requires_approval": False,
-        }
-
     async def test_init(self, client):
         """Test client initialization."""
         assert client.base_url == "http://localhost:8000"
@@ -65,188 +93,178 @@ class TestAgentClient:
             assert client._client is not None
         assert client._client is None
 
-    @pytest.mark.asyncio
-    async def test_health_check_success(self, client):
-        """Test successful health check."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "healthy", "version": "2.0.0"}
-        mock_response.raise_for_status = MagicMock()
+    async def test_client_uses_keepalive_pool(self, client):
+        """Test the lazily created client keeps pooled connections alive."""
+        with patch("src.agent.client.httpx.AsyncClient") as mock_client_cls:
+            await client._ensure_client()
+            client._client = None
 
-        with patch.object(client, "_ensure_client") as mock_ensure:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = mock_response
-            mock_ensure.return_value = mock_client
+        limits = mock_client_cls.call_args.kwargs["limits"]
+        assert limits is POOL_LIMITS
+        assert limits.max_keepalive_connections >= 5
+        assert limits.keepalive_expiry >= 15.0
 
-            result = await client.health_check()
+    async def test_close(self, client):
+        """Test closing the client."""
+        async with client:
+            assert client._client is not None
+
+        assert client._client is None
+
+
+class TestAgentClientRequests:
+    """Tests for AgentClient requests, served by an httpx MockTransport."""
+
+    @pytest.fixture(scope="class")
+    def routes(self) -> dict[tuple[str, str], Route]:
+        """Route table read by the shared transport on every request."""
+        return {}
+
+    @pytest.fixture(scope="class")
+    async def client(self, routes):
+        """Agent client whose real httpx client is wired to the mock transport."""
+        agent = AgentClient(base_url="http://testserver", api_key="test-key", max_retries=2)
+        await agent._ensure_client()
+        # Swap in the mock transport but keep the headers, base URL and
+        # limits the client configured for itself
+        real = agent._client
+        agent._client = httpx.AsyncClient(
+            base_url=real.base_url,
+            headers=real.headers,
+            timeout=real.timeout,
+            limits=POOL_LIMITS,
+            transport=make_transport(routes),
+        )
+        await real.aclose()
+        yield agent
+        await agent.close()
+
+    @pytest.fixture(autouse=True)
+    def clear_routes(self, routes):
+        """Drop routes registered by the previous test."""
+        yield
+        routes.clear()
+
+    async def test_health_check_success(self, client, routes):
+        """Test successful health check."""
+        routes["GET", "/health"] = _reply(200, b'{"status":"healthy","version":"2.0.0"}')
 
-            assert result == {"status": "healthy", "version": "2.0.0"}
-            mock_client.get.assert_called_once_with("/health")
+        result = await client.health_check()
 
-    @pytest.mark.asyncio
-    async def test_health_check_connection_error(self, client):
+        assert result == {"status": "healthy", "version": "2.0.0"}
+
+    async def test_health_check_connection_error(self, client, routes):
         """Test health check with connection error."""
-        with patch.object(client, "_ensure_client") as mock_ensure:
-            mock_client = AsyncMock()
-            mock_client.get.side_effect = httpx.ConnectError("Connection refused")
-            mock_ensure.return_value = mock_client
+        routes["GET", "/health"] = _fail(httpx.ConnectError("Connection refused"))
 
-            with pytest.raises(AgentConnectionError, match="Failed to connect"):
-                await client.health_check()
+        with pytest.raises(AgentConnectionError, match="Failed to connect"):
+            await client.health_check()
 
-    @pytest.mark.asyncio
-    async def test_chat_success(self, client, chat_response_data):
+    async def test_chat_success(self, client, routes):
         """Test successful chat request."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = chat_response_data
-
-        with patch.object(client, "_ensure_client") as mock_ensure:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_ensure.return_value = mock_client
-
-            result = await client.chat(
-                message="Find suppliers for heat treatment",
-                session_id="sess-123",
-                user_id="user-456",
-            )
+        seen: list[httpx.Request] = []
+
+        def chat(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, content=_CHAT_RESPONSE_BODY)
+
+        routes["POST", "/api/v1/chat"] = chat
+
+        result = await client.chat(
+            message="Find suppliers for heat treatment",
+            session_id="sess-123",
+            user_id="user-456",
+        )
 
-            assert isinstance(result, ChatResponse)
-            assert result.session_id == "sess-123"
-            assert result.message == "Here are the suppliers for heat treatment."
-            assert result.intent == "supplier_search"
-            assert result.confidence == 0.95
+        assert isinstance(result, ChatResponse)
+        assert result.session_id == "sess-123"
+        assert result.message == "Here are the suppliers for heat treatment."
+        assert result.intent == "supplier_search"
+        assert result.confidence == 0.95
 
-    @pytest.mark.asyncio
-    async def test_chat_timeout(self, client):
+        (request,) = seen
+        assert request.headers["Authorization"] == "Bearer test-key"
+        assert json.loads(request.content) == {
+            "message": "Find suppliers for heat treatment",
+            "session_id": "sess-123",
+            "user_id": "user-456",
+        }
+
+    async def test_chat_timeout(self, client, routes):
         """Test chat request timeout."""
-        with patch.object(client, "_ensure_client") as mock_ensure:
-            mock_client = AsyncMock()
-            mock_client.post.side_effect = httpx.TimeoutException("Timeout")
-            mock_ensure.return_value = mock_client
+        routes["POST", "/api/v1/chat"] = _fail(httpx.TimeoutException("Timeout"))
 
-            with pytest.raises(AgentTimeoutError, match="timed out"):
-                await client.chat(message="Test")
+        with pytest.raises(AgentTimeoutError, match="timed out"):
+            await client.chat(message="Test")
 
-    @pytest.mark.asyncio
-    async def test_chat_connection_error(self, client):
+    async def test_chat_connection_error(self, client, routes):
         """Test chat with connection error."""
-        with patch.object(client, "_ensure_client") as mock_ensure:
-            mock_client = AsyncMock()
-            mock_client.post.side_effect = httpx.ConnectError("Connection refused")
-            mock_ensure.return_value = mock_client
+        routes["POST", "/api/v1/chat"] = _fail(httpx.ConnectError("Connection refused"))
 
-            with pytest.raises(AgentConnectionError, match="Failed to connect"):
-                await client.chat(message="Test")
+        with pytest.raises(AgentConnectionError, match="Failed to connect"):
+            await client.chat(message="Test")
 
-    @pytest.mark.asyncio
-    async def test_chat_validation_error(self, client):
+    async def test_chat_validation_error(self, client, routes):
         """Test chat with validation error (422)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 422
-        mock_response.json.return_value = {"detail": "Message too long"}
+        routes["POST", "/api/v1/chat"] = _reply(422, b'{"detail":"Message too long"}')
 
-        with patch.object(client, "_ensure_client") as mock_ensure:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_ensure.return_value = mock_client
+        with pytest.raises(AgentAPIError) as exc_info:
+            await client.chat(message="Test")
 
-            with pytest.raises(AgentAPIError) as exc_info:
-                await client.chat(message="Test")
+        assert exc_info.value.status_code == 422
+        assert exc_info.value.detail == "Message too long"
 
-            assert exc_info.value.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_chat_retries_on_timeout(self, client):
+    async def test_chat_retries_on_timeout(self, client, routes):
         """Test that chat retries on timeout."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "session_id": "sess-123",
-            "message": "Success after retry",
-            "agents_executed": [],
-        }
-
         call_count = 0
 
-        async def mock_post(*args, **kwargs):
+        def chat(request: httpx.Request) -> httpx.Response:
             nonlocal call_count
             call_count += 1
             if call_count < 2:
                 raise httpx.TimeoutException("Timeout")
-            return mock_response
+            return httpx.Response(
+                200, content=b'{"session_id":"sess-123","message":"Success after retry"}'
+            )
 
-        with patch.object(client, "_ensure_client") as mock_ensure:
-            mock_client = AsyncMock()
-            mock_client.post = mock_post
-            mock_ensure.return_value = mock_client
+        routes["POST", "/api/v1/chat"] = chat
 
-            result = await client.chat(message="Test")
+        result = await client.chat(message="Test")
 
-            assert result.message == "Success after retry"
-            assert call_count == 2
+        assert result.message == "Success after retry"
+        assert call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_get_session_success(self, client):
+    async def test_get_session_success(self, client, routes):
         """Test successful get session."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "session_id": "sess-123",
-            "status": "active",
-            "created_at": "2024-01-15T10:00:00Z",
-            "last_activity": "2024-01-15T10:30:00Z",
-            "message_count": 5,
-            "messages": [],
-        }
-        mock_response.raise_for_status = MagicMock()
-
-        with patch.object(client, "_ensure_client") as mock_ensure:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = mock_response
-            mock_ensure.return_value = mock_client
+        routes["GET", "/api/v1/sessions/sess-123"] = _reply(200, _SESSION_BODY)
 
-            result = await client.get_session("sess-123")
+        result = await client.get_session("sess-123")
 
-            assert result.session_id == "sess-123"
-            assert result.message_count == 5
+        assert result.session_id == "sess-123"
+        assert result.message_count == 5
 
-    @pytest.mark.asyncio
-    async def test_get_session_not_found(self, client):
+    async def test_get_session_not_found(self, client, routes):
         """Test get session when not found."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-
-        with patch.object(client, "_ensure_client") as mock_ensure:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = mock_response
-            mock_ensure.return_value = mock_client
+        routes["GET", "/api/v1/sessions/nonexistent"] = _reply(404)
 
-            with pytest.raises(AgentAPIError) as exc_info:
-                await client.get_session("nonexistent")
+        with pytest.raises(AgentAPIError) as exc_info:
+            await client.get_session("nonexistent")
 
-            assert exc_info.value.status_code == 404
+        assert exc_info.value.status_code == 404
 
-    @pytest.mark.asyncio
-    async def test_delete_session_success(self, client):
+    async def test_delete_session_success(self, client, routes):
         """Test successful delete session."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
+        routes["DELETE", "/api/v1/sessions/sess-123"] = _reply(200)
 
-        with patch.object(client, "_ensure_client") as mock_ensure:
-            mock_client = AsyncMock()
-            mock_client.delete.return_value = mock_response
-            mock_ensure.return_value = mock_client
+        result = await client.delete_session("sess-123")
 
-            result = await client.delete_session("sess-123")
+        assert result is True
 
-            assert result is True
+    async def test_delete_session_error(self, client, routes):
+        """Test a failed delete surfaces the status code."""
+        routes["DELETE", "/api/v1/sessions/sess-123"] = _reply(500)
 
-    async def test_close(self, client):
-        """Test closing the client."""
-        async with client:
-            assert client._client is not None
+        with pytest.raises(AgentAPIError) as exc_info:
+            await client.delete_session("sess-123")
 
-        assert client._client is None
+        assert exc_info.value.status_code == 500
@@ -1,5 +1,9 @@
 """Tests for Agent API models."""
 
+from datetime import datetime, timezone
+
+import pytest
+
 from src.agent.models import (
     AgentExecution,
     AgentStatus,
@@ -15,26 +19,37 @@ from src.agent.models import (
 class TestEnums:
     """Tests for enum types."""
 
-    def test_agent_status_values(self):
-        """Test AgentStatus enum values."""
-        assert AgentStatus.PENDING == "pending"
-        assert AgentStatus.RUNNING == "running"
-        assert AgentStatus.COMPLETED == "completed"
-        assert AgentStatus.ERROR == "error"
-        assert AgentStatus.SKIPPED == "skipped"
-
-    def test_session_status_values(self):
-        """Test SessionStatus enum values."""
-        assert SessionStatus.ACTIVE == "active"
-        assert SessionStatus.COMPLETED == "completed"
-        assert SessionStatus.EXPIRED == "expired"
-        assert SessionStatus.ERROR == "error"
-
-    def test_message_role_values(self):
-        """Test MessageRole enum values."""
-        assert MessageRole.USER == "user"
-        assert MessageRole.ASSISTANT == "assistant"
-        assert MessageRole.SYSTEM == "system"
+    @pytest.mark.parametrize(
+        ("enum_cls", "expected"),
+        [
+            (
+                AgentStatus,
+                {
+                    "PENDING": "pending",
+                    "RUNNING": "running",
+                    "COMPLETED": "completed",
+                    "ERROR": "error",
+                    "SKIPPED": "skipped",
+                },
+            ),
+            (
+                SessionStatus,
+                {
+                    "ACTIVE": "active",
+                    "COMPLETED": "completed",
+                    "EXPIRED": "expired",
+                    "ERROR": "error",
+                },
+            ),
+            (MessageRole, {"USER": "user", "ASSISTANT": "assistant", "SYSTEM": "system"}),
+        ],
+        ids=["agent_status", "session_status", "message_role"],
+    )
+    def test_enum_values(self, enum_cls, expected):
+        """Test each enum has exactly the expected members and string values."""
+        assert {m.name: m.value for m in enum_cls} == expected
+        for name, value in expected.items():
+            assert getattr(enum_cls, name) == value
 
 
 class TestChatRequest:
@@ -175,6 +190,15 @@ class TestMessage:
         assert message.content == "What is the policy?"
         assert message.timestamp is not None
 
+    def test_message_timestamp_cached(self):
+        """Test repeated timestamp strings share one parsed datetime."""
+        data = {"role": "user", "content": "x", "timestamp": "2024-01-15T10:30:00Z"}
+        first = Message.from_dict(data)
+        second = Message.from_dict(dict(data))
+
+        assert first.timestamp is second.timestamp
+        assert first.timestamp == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
     def test_from_dict_without_timestamp(self):
         """Test creating message without timestamp."""
         data = {
@@ -236,3 +260,30 @@ class TestSessionResponse:
 
         assert session.messages == []
         assert session.message_count == 0
+
+    def test_from_dict_is_slotted(self):
+        """Test parsed sessions and their messages carry no instance dict."""
+        data = {
+            "session_id": "sess-123",
+            "status": "active",
+            "created_at": "2024-01-15T10:00:00Z",
+            "last_activity": "2024-01-15T10:00:00Z",
+            "message_count": 1,
+            "messages": [{"role": "user", "content": "Hello"}],
+        }
+        session = SessionResponse.from_dict(data)
+
+        assert not hasattr(session, "__dict__")
+        assert not hasattr(session.messages[0], "__dict__")
+
+    def test_from_dict_unknown_status_raises(self):
+        """Test unknown status values still raise ValueError."""
+        data = {
+            "session_id": "sess-123",
+            "status": "archived",
+            "created_at": "2024-01-15T10:00:00Z",
+            "last_activity": "2024-01-15T10:00:00Z",
+            "message_count": 0,
+        }
+        with pytest.raises(ValueError):
+            SessionResponse.from_dict(data)
@@ -3,36 +3,87 @@
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import structlog
 
 from src.agent.client import AgentClientError, AgentTimeoutError
 from src.agent.models import AgentExecution, AgentStatus, ChatResponse
-from src.teams.receiver.handler import COMMANDS, TeamsMessageHandler
+from src.teams.common.processor import COMMANDS
+from src.teams.receiver.handler import TeamsMessageHandler
 from src.teams.receiver.models import TeamsMessage, TeamsResponse
 
 
+def _message(text: str) -> TeamsMessage:
+    """Build a message from user u1 in conversation c1."""
+    return TeamsMessage.from_dict(
+        {
+            "id": "msg-1",
+            "text": text,
+            "from": {"id": "u1", "name": "User"},
+            "conversation": {"id": "c1"},
+        }
+    )
+
+
+# Safe to share across tests: messages are frozen, and the clean-text/command
+# memo they pick up after parsing is derived solely from ``text``
+_STATUS_MSG = _message("<at>Bot</at> /status")
+_EMPTY_MSG = _message("<at>Bot</at>")
+
+_AGENT_RESPONSE = ChatResponse(
+    session_id="sess-123",
+    message="You have 15 vacation days per year.",
+    agents_executed=[
+        AgentExecution(
+            agent_name="intent",
+            display_name="Intent Classifier",
+            status=AgentStatus.COMPLETED,
+            duration_ms=50,
+        )
+    ],
+    intent="hr_inquiry",
+    confidence=0.95,
+)
+
+# Command token -> substring expected in the reply (agent reports healthy 2.0.0)
+_COMMAND_REPLIES = {
+    "help": "Available Commands",
+    "HELP": "Available Commands",
+    "Help": "Available Commands",
+    "clear": "Conversation cleared",
+    "status": "**Agent Status:** healthy\n**Version:** 2.0.0",
+    "unknown": "Unknown command: /unknown",
+}
+
+
 class TestTeamsMessageHandler:
     """Tests for TeamsMessageHandler class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_agent_client(self):
-        """Create a mock agent client."""
+        """Create a mock agent client shared by the class."""
         client = MagicMock()
         client.chat = AsyncMock()
         client.health_check = AsyncMock()
         return client
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def reset_agent_client(self, mock_agent_client):
+        """Clear calls, return values and side effects left by the previous test."""
+        yield
+        mock_agent_client.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(scope="class")
     def handler(self, mock_agent_client):
-        """Create a handler with mock client."""
+        """Create a handler with mock client, shared by the class."""
         return TeamsMessageHandler(
             agent_client=mock_agent_client,
             timeout_message="Request timed out",
             error_message="An error occurred",
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_message(self):
-        """Create a sample Teams message."""
+        """Create a sample Teams message, shared like the module-level ones."""
         return TeamsMessage.from_dict(
             {
                 "id": "msg-123",
@@ -42,35 +93,10 @@ class TestTeamsMessageHandler:
             }
         )
 
-    @pytest.fixture
-    def command_message(self):
-        """Create a command message."""
-        return TeamsMessage.from_dict(
-            {
-                "id": "msg-cmd",
-                "text": "<at>Bot</at> /help",
-                "from": {"id": "user-1", "name": "User"},
-                "conversation": {"id": "conv-1"},
-            }
-        )
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def agent_response(self):
-        """Create a sample agent response."""
-        return ChatResponse(
-            session_id="sess-123",
-            message="You have 15 vacation days per year.",
-            agents_executed=[
-                AgentExecution(
-                    agent_name="intent",
-                    display_name="Intent Classifier",
-                    status=AgentStatus.COMPLETED,
-                    duration_ms=50,
-                )
-            ],
-            intent="hr_inquiry",
-            confidence=0.95,
-        )
+        """Sample agent response (never mutated by the handler)."""
+        return _AGENT_RESPONSE
 
     async def test_handle_regular_message(
         self, handler, mock_agent_client, sample_message, agent_response
@@ -88,98 +114,30 @@ class TestTeamsMessageHandler:
             session_id=None,
         )
 
-    async def test_handle_help_command(self, handler, command_message):
-        """Test handling /help command."""
-        response = await handler.handle(command_message)
+    @pytest.mark.parametrize(("command", "expected"), _COMMAND_REPLIES.items())
+    async def test_command_dispatch(self, handler, mock_agent_client, command, expected):
+        """Test each command token, in any case, reaches the right reply."""
+        mock_agent_client.health_check.return_value = {"status": "healthy", "version": "2.0.0"}
 
-        assert isinstance(response, TeamsResponse)
-        assert "Available Commands" in response.text
-        for cmd in COMMANDS:
-            assert f"/{cmd}" in response.text
-
-    async def test_handle_clear_command(self, handler):
-        """Test handling /clear command."""
-        message = TeamsMessage.from_dict(
-            {
-                "id": "msg-1",
-                "text": "<at>Bot</at> /clear",
-                "from": {"id": "u1", "name": "User"},
-                "conversation": {"id": "c1"},
-            }
-        )
-
-        response = await handler.handle(message)
-
-        assert "cleared" in response.text.lower()
-
-    async def test_handle_status_command_healthy(self, handler, mock_agent_client):
-        """Test handling /status command when agent is healthy."""
-        mock_agent_client.health_check.return_value = {
-            "status": "healthy",
-            "version": "2.0.0",
-        }
-
-        message = TeamsMessage.from_dict(
-            {
-                "id": "msg-1",
-                "text": "<at>Bot</at> /status",
-                "from": {"id": "u1", "name": "User"},
-                "conversation": {"id": "c1"},
-            }
-        )
+        response = await handler.handle(_message(f"<at>Bot</at> /{command}"))
 
-        response = await handler.handle(message)
-
-        assert "healthy" in response.text
-        assert "2.0.0" in response.text
+        assert isinstance(response, TeamsResponse)
+        assert expected in response.text
 
     async def test_handle_status_command_error(self, handler, mock_agent_client):
         """Test handling /status command when agent is unavailable."""
         mock_agent_client.health_check.side_effect = AgentClientError("Connection refused")
 
-        message = TeamsMessage.from_dict(
-            {
-                "id": "msg-1",
-                "text": "<at>Bot</at> /status",
-                "from": {"id": "u1", "name": "User"},
-                "conversation": {"id": "c1"},
-            }
-        )
-
-        response = await handler.handle(message)
+        response = await handler.handle(_STATUS_MSG)
 
         assert "Unavailable" in response.text
 
-    async def test_handle_unknown_command(self, handler):
-        """Test handling unknown command."""
-        message = TeamsMessage.from_dict(
-            {
-                "id": "msg-1",
-                "text": "<at>Bot</at> /unknown",
-                "from": {"id": "u1", "name": "User"},
-                "conversation": {"id": "c1"},
-            }
-        )
-
-        response = await handler.handle(message)
-
-        assert "Unknown command" in response.text
-        assert "/unknown" in response.text
-
     async def test_handle_empty_message(self, handler):
         """Test handling message with only mention (no text)."""
-        message = TeamsMessage.from_dict(
-            {
-                "id": "msg-1",
-                "text": "<at>Bot</at>",
-                "from": {"id": "u1", "name": "User"},
-                "conversation": {"id": "c1"},
-            }
-        )
-
-        response = await handler.handle(message)
+        response = await handler.handle(_EMPTY_MSG)
 
         assert "didn't catch that" in response.text.lower()
+        assert response is await handler.handle(_EMPTY_MSG)
 
     async def test_handle_agent_timeout(self, handler, mock_agent_client, sample_message):
         """Test handling agent timeout."""
@@ -207,26 +165,33 @@ class TestTeamsMessageHandler:
         assert isinstance(response, TeamsResponse)
         assert response.text == agent_response.message
 
-    def test_build_help_response(self, handler):
-        """Test building help response."""
-        response = handler._build_help_response()
+    async def test_handle_help(self, handler):
+        """Test the /help reply lists every command."""
+        response = await handler._handle_help()
 
         assert "Available Commands" in response.text
         assert "/help" in response.text
         assert "/clear" in response.text
         assert "/status" in response.text
+        assert response is await handler._handle_help()
 
-    async def test_handle_command_case_insensitive(self, handler):
-        """Test that commands are case-insensitive."""
-        message = TeamsMessage.from_dict(
-            {
-                "id": "msg-1",
-                "text": "<at>Bot</at> /HELP",
-                "from": {"id": "u1", "name": "User"},
-                "conversation": {"id": "c1"},
-            }
-        )
+    async def test_handle_binds_request_context(
+        self, handler, mock_agent_client, sample_message, agent_response
+    ):
+        """Test request fields are bound as contextvars only while handling."""
+        seen = {}
 
-        response = await handler.handle(message)
+        async def chat(**kwargs):
+            seen.update(structlog.contextvars.get_contextvars())
+            return agent_response
 
-        assert "Available Commands" in response.text
+        mock_agent_client.chat.side_effect = chat
+        await handler.handle(sample_message)
+
+        assert seen["message_id"] == "msg-123"
+        assert seen["user_id"] == "aad-789"
+        assert "message_id" not in structlog.contextvars.get_contextvars()
+
+    def test_command_dispatch_covers_all_commands(self, handler):
+        """Test that every advertised command has a dispatch entry."""
+        assert set(handler._command_handlers) == set(COMMANDS)
@@ -1,8 +1,6 @@
 """Tests for HMAC signature verification."""
 
 import base64
-import hashlib
-import hmac
 
 import pytest
 
@@ -11,26 +9,24 @@ from src.teams.receiver.hmac import (
     HMACVerifier,
     create_verifier,
 )
+from tests.mocks.signing import sign
 
 
 class TestHMACVerifier:
     """Tests for HMACVerifier class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_secret(self):
         """A valid Base64-encoded secret."""
         return base64.b64encode(b"test-secret-key").decode()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def verifier(self, valid_secret):
-        """Create a verifier with valid secret."""
-        return HMACVerifier(valid_secret)
+        """Create a verifier with valid secret, shared by the module.
 
-    def _compute_signature(self, secret: str, body: bytes) -> str:
-        """Helper to compute HMAC signature."""
-        secret_bytes = base64.b64decode(secret)
-        signature = hmac.new(secret_bytes, body, hashlib.sha256).digest()
-        return base64.b64encode(signature).decode()
+        verify() copies the prepared HMAC state per call, so sharing is safe.
+        """
+        return HMACVerifier(valid_secret)
 
     def test_init_with_valid_secret(self, valid_secret):
         """Test initialization with valid Base64 secret."""
@@ -50,12 +46,20 @@ class TestHMACVerifier:
     def test_verify_valid_signature(self, verifier, valid_secret):
         """Test verification with valid signature."""
         body = b'{"message": "hello"}'
-        signature = self._compute_signature(valid_secret, body)
+        signature = sign(valid_secret, body)
         auth_header = f"HMAC {signature}"
 
         result = verifier.verify(auth_header, body)
         assert result is True
 
+    def test_verify_accepts_memoryview_body(self, verifier, valid_secret):
+        """Test verification over a buffer without copying to bytes."""
+        body = b'{"message": "hello"}'
+        signature = sign(valid_secret, body)
+
+        assert verifier.verify(f"HMAC {signature}", memoryview(body)) is True
+        assert verifier.verify(f"HMAC {signature}", bytearray(body)) is True
+
     def test_verify_missing_header_raises(self, verifier):
         """Test that missing header raises error."""
         with pytest.raises(HMACVerificationError, match="Missing Authorization"):
@@ -78,10 +82,17 @@ class TestHMACVerifier:
         with pytest.raises(HMACVerificationError, match="Invalid HMAC signature"):
             verifier.verify(auth_header, b"body")
 
+    def test_verify_valid_base64_wrong_digest_raises(self, verifier):
+        """Test that a well-formed signature for another key is rejected."""
+        other = sign(base64.b64encode(b"other-key").decode(), b"body")
+
+        with pytest.raises(HMACVerificationError, match="Invalid HMAC signature"):
+            verifier.verify(f"HMAC {other}", b"body")
+
     def test_verify_case_insensitive_hmac(self, verifier, valid_secret):
         """Test that HMAC prefix is case-insensitive."""
         body = b"test"
-        signature = self._compute_signature(valid_secret, body)
+        signature = sign(valid_secret, body)
 
         # Lowercase should work
         result = verifier.verify(f"hmac {signature}", body)
@@ -90,12 +101,18 @@ class TestHMACVerifier:
     def test_verify_different_body_fails(self, verifier, valid_secret):
         """Test that signature for different body fails."""
         original_body = b"original"
-        signature = self._compute_signature(valid_secret, original_body)
+        signature = sign(valid_secret, original_body)
         auth_header = f"HMAC {signature}"
 
         with pytest.raises(HMACVerificationError, match="Invalid HMAC signature"):
             verifier.verify(auth_header, b"different")
 
+    def test_verify_repeated_calls_do_not_share_state(self, verifier, valid_secret):
+        """Test that the prepared HMAC state is not mutated between requests."""
+        for body in (b"first", b"second", b"first"):
+            signature = sign(valid_secret, body)
+            assert verifier.verify(f"HMAC {signature}", body) is True
+
     def test_is_configured(self, verifier):
         """Test is_configured returns True when secret is set."""
         assert verifier.is_configured() is True
@@ -112,6 +129,12 @@ class TestCreateVerifier:
         assert verifier is not None
         assert isinstance(verifier, HMACVerifier)
 
+    def test_create_reuses_verifier_for_same_secret(self):
+        """Test that the factory caches verifiers per secret."""
+        secret = base64.b64encode(b"cached-secret").decode()
+
+        assert create_verifier(secret) is create_verifier(secret)
+
     def test_create_with_none_returns_none(self):
         """Test that None secret returns None."""
         verifier = create_verifier(None)
@@ -126,3 +149,12 @@ class TestCreateVerifier:
         """Test that invalid Base64 secret returns None."""
         verifier = create_verifier("invalid!!!")
         assert verifier is None
+
+    def test_create_strict_raises_on_invalid_secret(self):
+        """Test strict mode rejects a malformed secret instead of disabling HMAC."""
+        with pytest.raises(ValueError):
+            create_verifier("invalid!!!", strict=True)
+
+    def test_create_strict_allows_disabled_secret(self):
+        """Test strict mode still treats placeholder values as disabled."""
+        assert create_verifier("DISABLED", strict=True) is None
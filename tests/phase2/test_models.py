@@ -1,5 +1,9 @@
 """Tests for Teams receiver models."""
 
+import dataclasses
+import json
+from unittest.mock import MagicMock
+
 import pytest
 
 from src.teams.receiver.models import (
@@ -11,6 +15,13 @@ from src.teams.receiver.models import (
 )
 
 
+def _msg(text: str, **extra):
+    """Build a message from user u1 in conversation c1, overriding any field."""
+    return TeamsMessage.from_dict(
+        {"id": "msg-1", "text": text, "from": {"id": "u1"}, "conversation": {"id": "c1"}, **extra}
+    )
+
+
 class TestTeamsUser:
     """Tests for TeamsUser dataclass."""
 
@@ -44,6 +55,14 @@ class TestTeamsUser:
         assert user.name == "Unknown"
         assert user.aad_object_id is None
 
+    def test_is_immutable_and_slotted(self):
+        """Test users are frozen and carry no per-instance __dict__."""
+        user = TeamsUser.from_dict({"id": "user-123"})
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            user.name = "Changed"
+        assert not hasattr(user, "__dict__")
+
 
 class TestTeamsConversation:
     """Tests for TeamsConversation dataclass."""
@@ -192,115 +211,98 @@ class TestTeamsMessage:
 
         assert clean == "What is the vacation policy?"
 
-    def test_get_clean_text_multiple_mentions(self):
-        """Test removing multiple @mentions."""
-        data = {
-            "id": "msg-1",
-            "text": "<at>Bot</at> hello <at>User</at> how are you",
-            "from": {"id": "u1"},
-            "conversation": {"id": "c1"},
-        }
-        msg = TeamsMessage.from_dict(data)
-
-        assert msg.get_clean_text() == "hello how are you"
-
-    def test_get_clean_text_no_mentions(self):
-        """Test clean text without mentions."""
-        data = {
-            "id": "msg-1",
-            "text": "Just a regular message",
-            "from": {"id": "u1"},
-            "conversation": {"id": "c1"},
-        }
-        msg = TeamsMessage.from_dict(data)
-
-        assert msg.get_clean_text() == "Just a regular message"
-
-    def test_is_command_true(self):
-        """Test command detection."""
-        data = {
-            "id": "msg-1",
-            "text": "<at>Bot</at> /help",
-            "from": {"id": "u1"},
-            "conversation": {"id": "c1"},
-        }
-        msg = TeamsMessage.from_dict(data)
-
-        assert msg.is_command() is True
-
-    def test_is_command_false(self):
-        """Test non-command detection."""
-        data = {
-            "id": "msg-1",
-            "text": "<at>Bot</at> hello",
-            "from": {"id": "u1"},
-            "conversation": {"id": "c1"},
-        }
-        msg = TeamsMessage.from_dict(data)
-
-        assert msg.is_command() is False
-
-    def test_get_command(self):
-        """Test extracting command and args."""
-        data = {
-            "id": "msg-1",
-            "text": "<at>Bot</at> /search suppliers",
-            "from": {"id": "u1"},
-            "conversation": {"id": "c1"},
-        }
-        msg = TeamsMessage.from_dict(data)
-        result = msg.get_command()
-
-        assert result is not None
-        command, args = result
-        assert command == "search"
-        assert args == "suppliers"
-
-    def test_get_command_no_args(self):
-        """Test extracting command without args."""
-        data = {
-            "id": "msg-1",
-            "text": "<at>Bot</at> /help",
-            "from": {"id": "u1"},
-            "conversation": {"id": "c1"},
-        }
-        msg = TeamsMessage.from_dict(data)
-        result = msg.get_command()
-
-        assert result is not None
-        command, args = result
-        assert command == "help"
-        assert args == ""
-
-    def test_get_command_not_command(self):
-        """Test get_command returns None for non-commands."""
-        data = {
-            "id": "msg-1",
-            "text": "hello",
-            "from": {"id": "u1"},
-            "conversation": {"id": "c1"},
-        }
-        msg = TeamsMessage.from_dict(data)
-
-        assert msg.get_command() is None
-
-    def test_get_user_identifier_with_aad(self, full_message_data):
-        """Test user identifier prefers AAD object ID."""
-        msg = TeamsMessage.from_dict(full_message_data)
-
-        assert msg.get_user_identifier() == "aad-789"
-
-    def test_get_user_identifier_without_aad(self):
-        """Test user identifier falls back to user ID."""
-        data = {
-            "id": "msg-1",
-            "text": "hello",
-            "from": {"id": "user-123", "name": "User"},
-            "conversation": {"id": "c1"},
-        }
-        msg = TeamsMessage.from_dict(data)
-
-        assert msg.get_user_identifier() == "user-123"
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("<at>Bot</at> hello <at>User</at> how are you", "hello how are you"),
+            ("Just a regular message", "Just a regular message"),
+        ],
+        ids=["multiple_mentions", "no_mentions"],
+    )
+    def test_get_clean_text_variants(self, text, expected):
+        """Test mention removal for several mentions and for none."""
+        assert _msg(text).get_clean_text() == expected
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "<at>Bot</at> What is the vacation policy?",
+            "<at>Valerie Bot</at>   /help me  ",
+            "<at>Bot</at>",
+            "<at>Bot</at> 1 < 2",
+        ],
+    )
+    def test_strip_mention_fast_path(self, text, monkeypatch):
+        """Test a single leading mention is removed without the regex."""
+        pattern = TeamsMessage.MENTION_PATTERN
+        spy = MagicMock(wraps=pattern)
+        monkeypatch.setattr(TeamsMessage, "MENTION_PATTERN", spy)
+
+        clean = _msg(text).get_clean_text()
+
+        assert clean == pattern.sub("", text).strip()
+        spy.sub.assert_not_called()
+
+    def test_get_clean_text_is_memoized(self):
+        """Test that clean text and command parse are computed once."""
+        msg = _msg("<at>Bot</at> /help me")
+
+        assert msg.get_clean_text() is msg.get_clean_text()
+        assert msg.get_command() is msg.get_command()
+        assert msg.get_command() == ("help", "me")
+
+    def test_is_frozen_after_memoizing(self):
+        """Test text cannot be reassigned under a memoized clean text."""
+        msg = _msg("<at>Bot</at> /help me")
+        msg.get_command()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            msg.text = "<at>Bot</at> /status"
+        assert msg.get_command() == ("help", "me")
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("<at>Bot</at> /help", True),
+            ("<at>Bot</at> hello", False),
+            # Without a leading mention
+            ("  /status", True),
+            ("hi /status", False),
+            ("", False),
+        ],
+    )
+    def test_is_command(self, text, expected):
+        """Test command detection with and without a leading mention."""
+        assert _msg(text).is_command() is expected
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("<at>Bot</at> /search suppliers", ("search", "suppliers")),
+            ("<at>Bot</at> /help", ("help", "")),
+            # Any separator splits like str.split
+            ("/search   a b", ("search", "a b")),
+            ("/search\ta b", ("search", "a b")),
+            ("/search\n a b", ("search", "a b")),
+            ("/Search\u00a0a b", ("search", "a b")),
+            ("hello", None),
+        ],
+    )
+    def test_get_command(self, text, expected):
+        """Test extracting the lowercased command and its args."""
+        assert _msg(text).get_command() == expected
+
+    @pytest.mark.parametrize(
+        ("sender", "expected"),
+        [
+            ({"id": "user-123", "name": "User", "aadObjectId": "aad-789"}, "aad-789"),
+            ({"id": "user-123", "name": "User"}, "user-123"),
+        ],
+        ids=["aad", "fallback_to_id"],
+    )
+    def test_get_user_identifier(self, sender, expected):
+        """Test user identifier prefers the AAD object ID over the user ID."""
+        assert _msg("hello", **{"from": sender}).get_user_identifier() == expected
 
     def test_get_session_key(self, full_message_data):
         """Test session key generation."""
@@ -397,3 +399,11 @@ class TestTeamsResponse:
         assert len(result["attachments"]) == 1
         assert result["attachments"][0]["contentType"] == "application/vnd.microsoft.card.adaptive"
         assert result["attachments"][0]["content"] == card
+
+    def test_to_json_bytes_matches_to_dict(self):
+        """Test JSON bytes serialization mirrors to_dict."""
+        response = TeamsResponse(text="Hola, ¿cómo estás?")
+        result = response.to_json_bytes()
+
+        assert isinstance(result, bytes)
+        assert json.loads(result) == response.to_dict()
@@ -0,0 +1,89 @@
+"""Micro-benchmarks for the agent and receiver hot paths.
+
+Run ``make bench`` to compare against the last saved run and fail on a
+mean regression above 20%.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.agent.models import SessionResponse
+from src.teams.receiver.handler import TeamsMessageHandler
+from src.teams.receiver.models import TeamsMessage
+
+BIG_SESSION_DICT = {
+    "session_id": "sess-123",
+    "status": "active",
+    "created_at": "2024-01-15T10:00:00Z",
+    "last_activity": "2024-01-15T10:30:00Z",
+    "message_count": 1000,
+    "messages": [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"Message {i}",
+            "timestamp": "2024-01-15T10:00:00Z",
+        }
+        for i in range(1000)
+    ],
+}
+
+TEAMS_PAYLOAD = {
+    "id": "msg-123",
+    "type": "message",
+    "text": "<at>Bot</at> What is the vacation policy?",
+    "timestamp": "2024-01-15T10:30:00Z",
+    "from": {"id": "user-456", "name": "Jane Doe", "aadObjectId": "aad-789"},
+    "conversation": {"id": "conv-abc", "conversationType": "channel"},
+    "entities": [{"type": "mention", "mentioned": {"id": "bot-1", "name": "Bot"}}],
+}
+
+CMD_MSG = TeamsMessage.from_dict(
+    {
+        "id": "msg-cmd",
+        "text": "<at>Bot</at> /help",
+        "from": {"id": "u1", "name": "User"},
+        "conversation": {"id": "c1"},
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def handler() -> TeamsMessageHandler:
+    """Handler whose agent client is never reached by /help."""
+    return TeamsMessageHandler(agent_client=MagicMock())
+
+
+@pytest.fixture
+def event_loop_runner():
+    """A private event loop for driving coroutines from sync benchmarks."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.mark.benchmark(group="models", min_rounds=50)
+def test_session_response_parse(benchmark) -> None:
+    """Benchmark parsing a session with 1000 messages."""
+    session = benchmark(SessionResponse.from_dict, BIG_SESSION_DICT)
+
+    assert len(session.messages) == 1000
+
+
+@pytest.mark.benchmark(group="models", min_rounds=50)
+def test_teams_message_parse(benchmark) -> None:
+    """Benchmark parsing a webhook payload and cleaning its text."""
+
+    def parse() -> str:
+        return TeamsMessage.from_dict(TEAMS_PAYLOAD).get_clean_text()
+
+    assert benchmark(parse) == "What is the vacation policy?"
+
+
+@pytest.mark.benchmark(group="handler", min_rounds=50)
+def test_handler_dispatch(benchmark, handler, event_loop_runner) -> None:
+    """Benchmark routing a command through TeamsMessageHandler.handle."""
+    response = benchmark(lambda: event_loop_runner(handler.handle(CMD_MSG)))
+
+    assert "Available Commands" in response.text
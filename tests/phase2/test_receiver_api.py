@@ -1,14 +1,59 @@
 """Integration tests for Teams Webhook Receiver API."""
 
 import base64
-import hashlib
-import hmac
-import json
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
 from src.agent.models import ChatResponse
+from src.teams.receiver import HMACVerifier
+from tests.mocks.signing import sign
+
+# /help is answered locally, so the webhook succeeds without a running agent
+_HELP_BODY = orjson.dumps(
+    {
+        "id": "msg-help",
+        "text": "<at>Bot</at> /help",
+        "from": {"id": "user-1", "name": "User"},
+        "conversation": {"id": "conv-1"},
+    }
+)
+
+# Request bodies are encoded once so signatures can be cached alongside them
+_SAMPLE_BODY = orjson.dumps(
+    {
+        "id": "msg-123",
+        "type": "message",
+        "text": "<at>Bot</at> What suppliers do heat treatment?",
+        "timestamp": "2024-01-15T10:30:00Z",
+        "from": {
+            "id": "user-456",
+            "name": "Test User",
+            "aadObjectId": "aad-789",
+        },
+        "conversation": {
+            "id": "conv-abc",
+            "conversationType": "channel",
+        },
+        "entities": [
+            {
+                "type": "mention",
+                "mentioned": {"id": "bot-id", "name": "Bot"},
+                "text": "<at>Bot</at>",
+            }
+        ],
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Receiver API test client; the app lifespan runs once for the module."""
+    from src.api.receiver_api import app
+
+    with TestClient(app) as client:
+        yield client
 
 
 class TestReceiverAPI:
@@ -20,36 +65,9 @@ class TestReceiverAPI:
         return base64.b64encode(b"test-secret-key").decode()
 
     @pytest.fixture
-    def sample_teams_payload(self):
-        """Sample Teams webhook payload."""
-        return {
-            "id": "msg-123",
-            "type": "message",
-            "text": "<at>Bot</at> What suppliers do heat treatment?",
-            "timestamp": "2024-01-15T10:30:00Z",
-            "from": {
-                "id": "user-456",
-                "name": "Test User",
-                "aadObjectId": "aad-789",
-            },
-            "conversation": {
-                "id": "conv-abc",
-                "conversationType": "channel",
-            },
-            "entities": [
-                {
-                    "type": "mention",
-                    "mentioned": {"id": "bot-id", "name": "Bot"},
-                    "text": "<at>Bot</at>",
-                }
-            ],
-        }
-
-    def _compute_hmac(self, secret: str, body: bytes) -> str:
-        """Compute HMAC signature."""
-        secret_bytes = base64.b64decode(secret)
-        signature = hmac.new(secret_bytes, body, hashlib.sha256).digest()
-        return base64.b64encode(signature).decode()
+    def sample_teams_body(self):
+        """Sample Teams webhook payload, encoded once for the module."""
+        return _SAMPLE_BODY
 
     @pytest.fixture
     def mock_agent_response(self):
@@ -62,28 +80,24 @@ class TestReceiverAPI:
             confidence=0.95,
         )
 
-    def test_health_check(self):
+    def test_health_check(self, client):
         """Test health endpoint."""
-        from src.api.receiver_api import app
-
-        with TestClient(app) as client:
-            response = client.get("/health")
+        response = client.get("/health")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "healthy"
-            assert data["version"] == "2.0.0"
-            assert data["phase"] == "2-stateless"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["version"] == "2.0.0"
+        assert data["phase"] == "2-stateless"
 
-    def test_webhook_processes_valid_message(self, sample_teams_payload):
+    def test_webhook_processes_valid_message(self, client, sample_teams_body):
         """Test webhook processes a valid Teams message and returns response."""
-        from src.api.receiver_api import app
         from src.core.config import settings
 
-        body = json.dumps(sample_teams_payload).encode()
+        body = sample_teams_body
 
         if settings.teams_hmac_secret:
-            signature = self._compute_hmac(settings.teams_hmac_secret, body)
+            signature = sign(settings.teams_hmac_secret, body)
             headers = {
                 "Content-Type": "application/json",
                 "Authorization": f"HMAC {signature}",
@@ -91,22 +105,20 @@ class TestReceiverAPI:
         else:
             headers = {"Content-Type": "application/json"}
 
-        with TestClient(app) as client:
-            response = client.post("/webhook", content=body, headers=headers)
-            assert response.status_code == 200
-            data = response.json()
-            assert data["type"] == "message"
-            assert "text" in data
+        response = client.post("/webhook", content=body, headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["type"] == "message"
+        assert "text" in data
 
-    def test_webhook_handles_invalid_json(self):
+    def test_webhook_handles_invalid_json(self, client):
         """Test webhook returns 400 for invalid JSON (when HMAC is valid)."""
-        from src.api.receiver_api import app
         from src.core.config import settings
 
         body = b"not json"
 
         if settings.teams_hmac_secret:
-            signature = self._compute_hmac(settings.teams_hmac_secret, body)
+            signature = sign(settings.teams_hmac_secret, body)
             headers = {
                 "Content-Type": "application/json",
                 "Authorization": f"HMAC {signature}",
@@ -114,16 +126,16 @@ class TestReceiverAPI:
         else:
             headers = {"Content-Type": "application/json"}
 
-        with TestClient(app) as client:
-            response = client.post("/webhook", content=body, headers=headers)
-            assert response.status_code == 400
+        response = client.post("/webhook", content=body, headers=headers)
+        assert response.status_code == 400
 
 
 class TestWebhookHMAC:
     """Tests for HMAC verification in webhook endpoint.
 
     Note: Full HMAC verification tests are in test_hmac.py.
-    These tests verify the API integration when HMAC is configured via env.
+    These tests verify the API integration with a verifier injected through
+    get_verifier or a secret set on settings.
     """
 
     @pytest.fixture
@@ -131,33 +143,83 @@ class TestWebhookHMAC:
         """Valid HMAC secret."""
         return base64.b64encode(b"test-secret").decode()
 
-    def _compute_hmac(self, secret: str, body: bytes) -> str:
-        """Compute HMAC signature."""
-        secret_bytes = base64.b64decode(secret)
-        signature = hmac.new(secret_bytes, body, hashlib.sha256).digest()
-        return base64.b64encode(signature).decode()
+    @pytest.fixture
+    def signed_client(self, client, hmac_secret):
+        """Client whose webhook verifies signatures against hmac_secret."""
+        from src.api.receiver_api import app, get_verifier
+
+        verifier = HMACVerifier(hmac_secret)
+        app.dependency_overrides[get_verifier] = lambda: verifier
+        yield client
+        del app.dependency_overrides[get_verifier]
+
+    def test_webhook_accepts_valid_signature(self, signed_client, hmac_secret):
+        """Test a correctly signed message is processed."""
+        body = _HELP_BODY
+        signature = sign(hmac_secret, body)
+
+        response = signed_client.post(
+            "/webhook",
+            content=body,
+            headers={"Content-Type": "application/json", "Authorization": f"HMAC {signature}"},
+        )
+
+        assert response.status_code == 200
+        assert "Available Commands" in response.json()["text"]
+
+    def test_webhook_missing_auth_header(self, signed_client):
+        """Test an unsigned message is rejected when HMAC is enabled."""
+        response = signed_client.post(
+            "/webhook",
+            content=_HELP_BODY,
+            headers={"Content-Type": "application/json"},
+        )
 
-    def test_webhook_with_valid_hmac_when_configured(self, hmac_secret):
-        """Test webhook works with valid HMAC when secret is configured via env."""
+        assert response.status_code == 401
+
+    def test_webhook_invalid_signature(self, signed_client):
+        """Test a message signed with the wrong secret is rejected."""
+        body = _HELP_BODY
+        signature = sign(base64.b64encode(b"wrong-secret").decode(), body)
+
+        response = signed_client.post(
+            "/webhook",
+            content=body,
+            headers={"Content-Type": "application/json", "Authorization": f"HMAC {signature}"},
+        )
+
+        assert response.status_code == 401
+
+    @pytest.fixture
+    def configured_secret(self, monkeypatch, hmac_secret):
+        """Set TEAMS_HMAC_SECRET on the loaded settings for this test only."""
         from src.core.config import settings
 
-        # Only run if HMAC is configured in the environment
-        if not settings.teams_hmac_secret:
-            pytest.skip("HMAC not configured - skipping integration test")
+        monkeypatch.setattr(settings, "teams_hmac_secret", hmac_secret)
+        return hmac_secret
 
+    def test_startup_fails_on_malformed_secret(self, monkeypatch):
+        """Test the app refuses to start rather than serve without HMAC."""
         from src.api.receiver_api import app
+        from src.core.config import settings
+
+        monkeypatch.setattr(settings, "teams_hmac_secret", "invalid!!!")
+
+        with pytest.raises(ValueError), TestClient(app):
+            pass
+
+    def test_webhook_uses_configured_secret(self, client, configured_secret):
+        """Test the webhook verifies against the secret from settings."""
+        signature = sign(configured_secret, _HELP_BODY)
+        headers = {"Content-Type": "application/json"}
+
+        unsigned = client.post("/webhook", content=_HELP_BODY, headers=headers)
+        signed = client.post(
+            "/webhook",
+            content=_HELP_BODY,
+            headers={**headers, "Authorization": f"HMAC {signature}"},
+        )
 
-        body = json.dumps({"id": "1", "text": "test", "from": {}, "conversation": {}}).encode()
-        signature = self._compute_hmac(settings.teams_hmac_secret, body)
-
-        with TestClient(app) as client:
-            response = client.post(
-                "/webhook",
-                content=body,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"HMAC {signature}",
-                },
-            )
-            # Should get 200 (message processed) not 401 (auth failed)
-            assert response.status_code == 200
+        assert unsigned.status_code == 401
+        assert signed.status_code == 200
+        assert client.get("/health").json()["hmac_enabled"] is True
@@ -0,0 +1 @@
+"""Session store tests."""
@@ -0,0 +1,85 @@
+"""Tests for session stores."""
+
+import pytest
+
+from src.session import CachedSessionStore, MemorySessionStore, create_session_store
+
+
+class TestCachedSessionStore:
+    """Tests for CachedSessionStore wrapper."""
+
+    @pytest.fixture
+    def backing_store(self):
+        """Create the backing in-memory store."""
+        return MemorySessionStore()
+
+    @pytest.fixture
+    def store(self, backing_store):
+        """Create a cached store over the backing store."""
+        return CachedSessionStore(backing_store, ttl_seconds=60)
+
+    async def test_get_served_from_cache(self, store, backing_store):
+        """Test repeated lookups do not hit the backing store."""
+        await store.set("u1", "c1", "sess-1")
+        first = await store.get("u1", "c1")
+        second = await store.get("u1", "c1")
+
+        assert first is second
+        assert first.session_id == "sess-1"
+        # Backing store counted only the first (uncached) lookup
+        assert (await backing_store.get("u1", "c1")).message_count == 3
+
+    async def test_set_invalidates_cache(self, store):
+        """Test writes replace the cached session."""
+        await store.set("u1", "c1", "sess-1")
+        await store.get("u1", "c1")
+        await store.set("u1", "c1", "sess-2")
+
+        assert (await store.get("u1", "c1")).session_id == "sess-2"
+
+    async def test_delete_invalidates_cache(self, store):
+        """Test deletes evict the cached session."""
+        await store.set("u1", "c1", "sess-1")
+        await store.get("u1", "c1")
+
+        assert await store.delete("u1", "c1") is True
+        assert await store.get("u1", "c1") is None
+
+    async def test_expired_entry_refetched(self, backing_store):
+        """Test entries past their TTL go back to the backing store."""
+        store = CachedSessionStore(backing_store, ttl_seconds=0)
+        await store.set("u1", "c1", "sess-1")
+        await store.get("u1", "c1")
+        await store.get("u1", "c1")
+
+        assert (await backing_store.get("u1", "c1")).message_count == 4
+
+    async def test_lru_eviction(self, backing_store):
+        """Test the least recently used entry is evicted at capacity."""
+        store = CachedSessionStore(backing_store, ttl_seconds=60, maxsize=1)
+        await store.set("u1", "c1", "sess-1")
+        await store.set("u2", "c2", "sess-2")
+        await store.get("u1", "c1")
+        await store.get("u2", "c2")
+
+        stats = await store.get_stats()
+        assert stats["cached_sessions"] == 1
+
+    async def test_close_closes_backing_store(self, store, backing_store, monkeypatch):
+        """Test closing the cache closes the store it wraps."""
+        closed = []
+
+        async def close():
+            closed.append(True)
+
+        monkeypatch.setattr(backing_store, "close", close)
+        await store.close()
+
+        assert closed == [True]
+
+    def test_factory_wraps_when_cache_enabled(self):
+        """Test factory returns a cached store only when TTL is positive."""
+        assert isinstance(create_session_store("memory", "", 24), MemorySessionStore)
+        assert isinstance(
+            create_session_store("memory", "", 24, cache_ttl_seconds=30), CachedSessionStore
+        )